@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Query, Depends, Header, Request
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -11,14 +11,19 @@ import logging
 from pathlib import Path
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 import imaplib
 import email
 from email.header import decode_header
 # google.generativeai removed: not used
 import re
 import asyncio
-from functools import lru_cache
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from cachetools import TTLCache
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 import secrets
@@ -49,7 +54,7 @@ if allowed_origins_env:
     except Exception:
         pass
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 app.add_middleware(
@@ -67,6 +72,9 @@ DEFAULT_USER_ID = "default"
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Verified against on unknown usernames so a login miss costs the same as a hit
+_DUMMY_HASH = pwd_context.hash("not-a-real-password")
+
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', secrets.token_urlsafe(32))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
@@ -150,82 +158,150 @@ class AssignRequest(BaseModel):
 class AddBikeNoteRequest(BaseModel):
     note: str
 
-async def sync_emails_background(user: dict, limit: int = 100) -> int:
+class AddBikeNotesBulkRequest(BaseModel):
+    notes: List[str]
+
+class ResolveTrackersRequest(BaseModel):
+    tracker_names: List[str]
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives, ~error_rate false positives)"""
+
+    def __init__(self, capacity: int, error_rate: float = 1e-3):
+        self.capacity = capacity
+        self.count = 0
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+EMAIL_ID_FILTER_MIN_CAPACITY = 100_000
+
+# user_id -> BloomFilter of stored email ids, built on the user's first sync in this process
+email_id_filters: dict = {}
+
+
+async def get_email_id_filter(conn, user_id: str) -> BloomFilter:
+    """Return the user's email id filter, loading it from the database on first use"""
+    bloom = email_id_filters.get(user_id)
+    if bloom is not None and bloom.count <= bloom.capacity:
+        return bloom
+    
+    rows = await conn.fetch(
+        "SELECT email_id FROM tracker_alerts WHERE user_id = $1",
+        user_id
+    )
+    # Headroom so steady growth doesn't push the false-positive rate up before a rebuild
+    bloom = BloomFilter(max(EMAIL_ID_FILTER_MIN_CAPACITY, len(rows) * 2))
+    for row in rows:
+        bloom.add(row['email_id'])
+    email_id_filters[user_id] = bloom
+    return bloom
+
+
+def remember_email_ids(user_id: str, email_ids: List[str]):
+    """Record newly stored email ids in the user's filter, if it is loaded"""
+    bloom = email_id_filters.get(user_id)
+    if bloom is not None:
+        for email_id in email_ids:
+            bloom.add(email_id)
+
+
+async def fetch_existing_email_ids(conn, user_id: str, email_ids: List[bytes]) -> set:
+    """Return which of the given IMAP ids are already stored for the user"""
+    if not email_ids:
+        return set()
+    
+    # Filter misses are definitely new; only possible hits need the database
+    bloom = await get_email_id_filter(conn, user_id)
+    candidates = [email_id.decode() for email_id in email_ids]
+    candidates = [email_id for email_id in candidates if email_id in bloom]
+    if not candidates:
+        return set()
+    
+    rows = await conn.fetch(
+        "SELECT email_id FROM tracker_alerts WHERE user_id = $1 AND email_id = ANY($2::varchar[])",
+        user_id, candidates
+    )
+    return {row['email_id'] for row in rows}
+
+
+async def sync_emails_background(user: asyncpg.Record, limit: int = 100) -> int:
     """Simple email sync for background task - returns count of new emails"""
     try:
         if not user.get('gmail_email') or not user.get('gmail_app_password'):
             return 0
         
-        imap = connect_imap(user['gmail_email'], user['gmail_app_password'])
-        imap.select("INBOX")
-        
         async with db_pool.acquire() as conn:
             checkpoint = await conn.fetchrow(
-                "SELECT * FROM sync_checkpoints WHERE user_id = $1",
+                "SELECT last_email_id, last_sync_at FROM sync_checkpoints WHERE user_id = $1",
                 user['id']
             )
         
-        _, message_numbers = imap.search(None, 'FROM "alerts-no-reply@tracking-update.com"')
-        email_ids = message_numbers[0].split()
-        
-        if checkpoint and checkpoint['last_email_id']:
-            try:
-                last_idx = email_ids.index(checkpoint['last_email_id'].encode())
-                email_ids = email_ids[last_idx + 1:]
-            except ValueError:
-                email_ids = email_ids[-limit:]
-        else:
-            email_ids = email_ids[-limit:]
+        # Only ask Gmail for mail since the last sync (a day of slack covers
+        # SINCE's date granularity and server timezone) instead of the whole history
+        since = None
+        if checkpoint and checkpoint['last_sync_at']:
+            since = checkpoint['last_sync_at'] - timedelta(days=1)
         
-        async with db_pool.acquire() as conn:
-            existing_ids = await conn.fetch(
-                "SELECT email_id FROM tracker_alerts WHERE user_id = $1",
-                user['id']
-            )
-            existing_set = {row['email_id'] for row in existing_ids}
+        async with imap_session(user['id'], user['gmail_email'], user['gmail_app_password']) as imap:
+            email_ids = await run_imap(search_alert_emails, imap, since)
             
-            email_data_list = []
-            for email_id in email_ids:
-                email_id_str = email_id.decode()
-                
-                if email_id_str in existing_set:
-                    continue
-                
+            if checkpoint and checkpoint['last_email_id']:
                 try:
-                    _, msg_data = imap.fetch(email_id, "(RFC822)")
-                    email_body = msg_data[0][1]
-                    msg = email.message_from_bytes(email_body)
-                    body = get_email_body(msg)
-                    email_data_list.append((email_id_str, body))
-                except Exception as e:
-                    logger.error(f"Error fetching email {email_id_str}: {str(e)}")
-            
-            imap.logout()
-            
-            if not email_data_list:
-                return 0
-            
-            batch_size = 10
-            total_processed = 0
-            
-            for i in range(0, len(email_data_list), batch_size):
-                batch = email_data_list[i:i + batch_size]
-                processed = await process_email_batch(batch, user['id'])
-                total_processed += processed
+                    last_idx = email_ids.index(checkpoint['last_email_id'].encode())
+                    email_ids = email_ids[last_idx + 1:]
+                except ValueError:
+                    email_ids = email_ids[-limit:]
+            else:
+                email_ids = email_ids[-limit:]
             
-            if email_data_list:
-                last_email_id = email_data_list[-1][0]
-                await conn.execute(
-                    """
-                    INSERT INTO sync_checkpoints (user_id, last_email_id, last_sync_at)
-                    VALUES ($1, $2, CURRENT_TIMESTAMP)
-                    ON CONFLICT (user_id) DO UPDATE
-                    SET last_email_id = $2, last_sync_at = CURRENT_TIMESTAMP
-                    """,
-                    user['id'], last_email_id
-                )
+            async with db_pool.acquire() as conn:
+                existing_set = await fetch_existing_email_ids(conn, user['id'], email_ids)
             
-            return total_processed
+            # No pool connection is held while talking to IMAP
+            to_fetch = [email_id for email_id in email_ids if email_id.decode() not in existing_set]
+            email_data_list = await run_imap(fetch_email_bodies, imap, to_fetch)
+        
+        if not email_data_list:
+            return 0
+        
+        total_processed = 0
+        
+        for i in range(0, len(email_data_list), ALERT_INSERT_BATCH_SIZE):
+            batch = email_data_list[i:i + ALERT_INSERT_BATCH_SIZE]
+            processed = await process_email_batch(batch, user['id'])
+            total_processed += processed
+        
+        last_email_id = email_data_list[-1][0]
+        async with db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO sync_checkpoints (user_id, last_email_id, last_sync_at)
+                VALUES ($1, $2, CURRENT_TIMESTAMP)
+                ON CONFLICT (user_id) DO UPDATE
+                SET last_email_id = $2, last_sync_at = CURRENT_TIMESTAMP
+                """,
+                user['id'], last_email_id
+            )
+        invalidate_user_caches(user['id'])
+        
+        return total_processed
     
     except Exception as e:
         logger.error(f"Email sync error for {user.get('username', 'unknown')}: {str(e)}")
@@ -291,8 +367,8 @@ async def validate_refresh_token(token: str) -> Optional[str]:
             return result['user_id']
         return None
 
-async def get_current_user(request: Request):
-    """Dependency to get current authenticated user from cookie"""
+async def get_current_user_id(request: Request) -> str:
+    """Dependency to get the authenticated user id from the cookie, without a database lookup"""
     token = request.cookies.get("access_token")
     
     if not token:
@@ -304,6 +380,13 @@ async def get_current_user(request: Request):
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
     
+    return user_id
+
+
+async def get_current_user(request: Request):
+    """Dependency to get current authenticated user from cookie"""
+    user_id = await get_current_user_id(request)
+    
     async with db_pool.acquire() as conn:
         user = await conn.fetchrow(
             "SELECT id, username, email, full_name, role, created_at FROM users WHERE id = $1",
@@ -316,6 +399,50 @@ async def get_current_user(request: Request):
         return dict(user)
 
 
+# Field labels in tracker emails ("Label: value" per line) -> parsed keys
+TRACKER_EMAIL_FIELDS = {
+    "Alert type": "alert_type",
+    "Time": "time",
+    "Location": "location",
+    "Latitude, Longitude": "coordinates",
+    "Device Serial Number": "device_serial",
+    "Tracker Name": "tracker_name",
+    "Account name": "account_name",
+}
+# List bullets, quote markers, bold/heading marks and HTML tags ahead of a label
+TRACKER_EMAIL_LINE_PREFIX_RE = re.compile(r'^(?:\s|[-*•>#_]|<[^>]*>)+')
+# The original anywhere-in-body searches, for labels the line scan misses
+# (e.g. several labels run together on one line)
+TRACKER_EMAIL_FALLBACK_RES = {
+    "alert_type": re.compile(r'Alert type:\s*(.+)'),
+    "time": re.compile(r'Time:\s*(.+?)(?:\(|$)', re.M),
+    "location": re.compile(r'Location:\s*(.+)'),
+    "coordinates": re.compile(r'Latitude, Longitude:\s*([-\d.]+),\s*([-\d.]+)'),
+    "device_serial": re.compile(r'Device Serial Number:\s*(.+)'),
+    "tracker_name": re.compile(r'Tracker Name:\s*(.+)'),
+    "account_name": re.compile(r'Account name:\s*(.+)'),
+}
+
+
+def strip_markup_edges(text: str) -> str:
+    """Strip whitespace, bold marks and HTML tags wrapped around a label or value ("**Label:** value")"""
+    # A plain loop rather than an end-anchored regex: a trailing-markup pattern
+    # backtracks badly over long runs of interior whitespace
+    while True:
+        stripped = text.strip().removeprefix("**").removesuffix("**").removeprefix("__").removesuffix("__")
+        if stripped.startswith("<"):
+            end = stripped.find(">")
+            if end >= 0:
+                stripped = stripped[end + 1:]
+        if stripped.endswith(">"):
+            start = stripped.rfind("<")
+            if start >= 0:
+                stripped = stripped[:start]
+        if stripped == text:
+            return text
+        text = stripped
+
+
 def parse_tracker_email(body: str) -> dict:
     """Parse tracker email to extract important information"""
     data = {
@@ -330,40 +457,52 @@ def parse_tracker_email(body: str) -> dict:
     }
     
     try:
-        alert_type_match = re.search(r'Alert type:\s*(.+)', body)
-        if alert_type_match:
-            data["alert_type"] = alert_type_match.group(1).strip()
-        
-        time_match = re.search(r'Time:\s*(.+?)(?:\(|$)', body)
-        if time_match:
-            data["time"] = time_match.group(1).strip()
-        
-        location_match = re.search(r'Location:\s*(.+)', body)
-        if location_match:
-            data["location"] = location_match.group(1).strip()
-        
-        coords_match = re.search(r'Latitude, Longitude:\s*([-\d.]+),\s*([-\d.]+)', body)
-        if coords_match:
-            data["latitude"] = coords_match.group(1).strip()
-            data["longitude"] = coords_match.group(2).strip()
-        
-        device_match = re.search(r'Device Serial Number:\s*(.+)', body)
-        if device_match:
-            data["device_serial"] = device_match.group(1).strip()
-        
-        tracker_match = re.search(r'Tracker Name:\s*(.+)', body)
-        if tracker_match:
-            data["tracker_name"] = tracker_match.group(1).strip()
-        
-        account_match = re.search(r'Account name:\s*(.+)', body)
-        if account_match:
-            data["account_name"] = account_match.group(1).strip()
+        # Single pass over the lines; the first occurrence of each label wins
+        for line in body.splitlines():
+            sep = line.find(':')
+            if sep < 0:
+                continue
+            
+            label = TRACKER_EMAIL_LINE_PREFIX_RE.sub('', line[:sep])
+            field = TRACKER_EMAIL_FIELDS.get(strip_markup_edges(label))
+            if not field:
+                continue
+            
+            value = strip_markup_edges(line[sep + 1:])
+            if not value:
+                continue
+            
+            if field == "coordinates":
+                if data["latitude"]:
+                    continue
+                parts = value.split(',')
+                if len(parts) >= 2:
+                    data["latitude"] = parts[0].strip()
+                    data["longitude"] = parts[1].strip()
+            elif not data[field]:
+                if field == "time":
+                    value = value.split('(', 1)[0].strip()
+                data[field] = value
+        
+        for field, pattern in TRACKER_EMAIL_FALLBACK_RES.items():
+            if data["latitude" if field == "coordinates" else field]:
+                continue
+            match = pattern.search(body)
+            if not match:
+                continue
+            if field == "coordinates":
+                data["latitude"] = match.group(1).strip()
+                data["longitude"] = match.group(2).strip()
+            else:
+                data[field] = match.group(1).strip()
     except Exception as e:
         logger.error(f"Error parsing email: {str(e)}")
     
     return data
 
 
+# Alert types come from a small fixed vocabulary, so repeat lookups are cache hits
+@lru_cache(maxsize=1024)
 def categorize_alert(alert_type: str) -> str:
     """Categorize alert based on type"""
     alert_lower = alert_type.lower()
@@ -403,170 +542,270 @@ def categorize_alert(alert_type: str) -> str:
         return "Other"
 
 
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+    id VARCHAR PRIMARY KEY,
+    username VARCHAR UNIQUE NOT NULL,
+    email VARCHAR UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    full_name VARCHAR,
+    gmail_email VARCHAR,
+    gmail_app_password VARCHAR,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS tracker_alerts (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR NOT NULL,
+    email_id VARCHAR NOT NULL,
+    alert_type VARCHAR,
+    alert_time VARCHAR,
+    location VARCHAR,
+    latitude VARCHAR,
+    longitude VARCHAR,
+    device_serial VARCHAR,
+    tracker_name VARCHAR,
+    account_name VARCHAR,
+    raw_body TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status VARCHAR DEFAULT 'New',
+    acknowledged BOOLEAN DEFAULT FALSE,
+    acknowledged_at TIMESTAMP,
+    acknowledged_by VARCHAR,
+    notes TEXT,
+    assigned_to VARCHAR,
+    favorite BOOLEAN DEFAULT FALSE,
+    UNIQUE(user_id, email_id)
+);
+
+-- Covers the list/stats filters (user, acknowledged, alert_type) and the
+-- created_at ordering; the partial index serves the default unread view.
+-- The UNIQUE(user_id, email_id) index already backs email id lookups.
+CREATE INDEX IF NOT EXISTS idx_tracker_alerts_user_ack_type_time
+    ON tracker_alerts (user_id, acknowledged, alert_type, created_at DESC)
+    INCLUDE (tracker_name, device_serial, location, latitude, longitude, alert_time);
+CREATE INDEX IF NOT EXISTS idx_tracker_alerts_user_unread_time
+    ON tracker_alerts (user_id, created_at DESC)
+    WHERE acknowledged IS NULL OR acknowledged = FALSE;
+-- Keyset pagination order for cursors: per user for user-scoped reads, and
+-- global for /alerts/list, which pages the shared alert table unfiltered
+CREATE INDEX IF NOT EXISTS idx_tracker_alerts_user_created_id
+    ON tracker_alerts (user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tracker_alerts_created_id
+    ON tracker_alerts (created_at DESC, id DESC);
+-- Per-bike rollups (user + tracker grouping with the latest alert and serial)
+-- and the newest-first alert history of a single tracker
+CREATE INDEX IF NOT EXISTS idx_tracker_alerts_user_tracker_time
+    ON tracker_alerts (user_id, tracker_name, created_at DESC)
+    INCLUDE (device_serial);
+CREATE INDEX IF NOT EXISTS idx_tracker_alerts_tracker_time
+    ON tracker_alerts (tracker_name, created_at DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS sync_checkpoints (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR NOT NULL UNIQUE,
+    last_email_id VARCHAR,
+    last_sync_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bikes (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR NOT NULL,
+    tracker_name VARCHAR NOT NULL,
+    device_serial VARCHAR,
+    latest_alert_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, tracker_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bikes_user_id ON bikes(user_id);
+CREATE INDEX IF NOT EXISTS idx_bikes_tracker_name ON bikes(tracker_name);
+
+CREATE TABLE IF NOT EXISTS bike_notes (
+    id SERIAL PRIMARY KEY,
+    bike_id INTEGER NOT NULL,
+    user_id VARCHAR NOT NULL,
+    note TEXT NOT NULL,
+    author VARCHAR NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (bike_id) REFERENCES bikes(id) ON DELETE CASCADE
+);
+
+-- Notes are always read per bike, newest first
+CREATE INDEX IF NOT EXISTS idx_bike_notes_bike_time
+    ON bike_notes (bike_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_bike_notes_bike_id;
+
+CREATE TABLE IF NOT EXISTS email_sync_runs (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR NOT NULL,
+    started_at TIMESTAMP NOT NULL,
+    completed_at TIMESTAMP NOT NULL,
+    source VARCHAR NOT NULL,
+    status VARCHAR NOT NULL,
+    emails_read INTEGER DEFAULT 0,
+    emails_new INTEGER DEFAULT 0,
+    error_summary TEXT,
+    log_json TEXT
+);
+
+CREATE TABLE IF NOT EXISTS refresh_tokens (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR NOT NULL,
+    token_hash VARCHAR NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+-- Sync configuration and role columns
+ALTER TABLE users
+ADD COLUMN IF NOT EXISTS sync_interval_minutes INTEGER DEFAULT 10,
+ADD COLUMN IF NOT EXISTS email_limit_per_sync INTEGER DEFAULT 100,
+ADD COLUMN IF NOT EXISTS role VARCHAR DEFAULT 'admin';
+
+-- Per-user alert counter for /system/status, kept current by statement-level
+-- triggers so bulk inserts and deletes bump it once per user per statement
+CREATE OR REPLACE FUNCTION bump_user_alerts_count_on_insert() RETURNS trigger AS $$
+BEGIN
+    UPDATE users u SET alerts_count = u.alerts_count + d.n
+    FROM (SELECT user_id, COUNT(*) AS n FROM new_rows GROUP BY user_id) d
+    WHERE u.id = d.user_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bump_user_alerts_count_on_delete() RETURNS trigger AS $$
+BEGIN
+    UPDATE users u SET alerts_count = u.alerts_count - d.n
+    FROM (SELECT user_id, COUNT(*) AS n FROM old_rows GROUP BY user_id) d
+    WHERE u.id = d.user_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Added together with its triggers and backfilled once, in the same transaction
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'users' AND column_name = 'alerts_count'
+    ) THEN
+        ALTER TABLE users ADD COLUMN alerts_count BIGINT NOT NULL DEFAULT 0;
+        
+        CREATE TRIGGER tracker_alerts_count_insert
+            AFTER INSERT ON tracker_alerts
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_user_alerts_count_on_insert();
+        CREATE TRIGGER tracker_alerts_count_delete
+            AFTER DELETE ON tracker_alerts
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_user_alerts_count_on_delete();
+        
+        UPDATE users u SET alerts_count = c.n
+        FROM (SELECT user_id, COUNT(*) AS n FROM tracker_alerts GROUP BY user_id) c
+        WHERE u.id = c.user_id;
+    END IF;
+END;
+$$;
+"""
+
+
 background_task = None
+imap_reaper_task = None
+
+DB_COMMAND_TIMEOUT_SECONDS = 60
+# Idle connections are closed after this long so a quiet app lets Neon's
+# compute auto-suspend; it also retires sockets before a proxy drops them
+DB_MAX_INACTIVE_CONNECTION_SECONDS = 300
+DB_SCHEMA_TIMEOUT_SECONDS = 600
+
+
+def is_transaction_pooler(database_url: str) -> bool:
+    """Neon's pooled endpoint runs PgBouncer in transaction mode"""
+    return "-pooler" in database_url
+
+
+def resolve_statement_cache_size(database_url: str) -> int:
+    """Per-connection prepared statement cache size (DB_STATEMENT_CACHE_SIZE overrides)"""
+    configured = os.environ.get("DB_STATEMENT_CACHE_SIZE")
+    if configured:
+        return int(configured)
+    # Cached statements raise InvalidCachedStatementError behind a transaction
+    # pooler; cache everywhere else so the fixed set of per-filter query texts
+    # is parsed and planned once per connection
+    return 0 if is_transaction_pooler(database_url) else 2048
+
+
+# Hot bike-endpoint statements. asyncpg invalidates PreparedStatement objects
+# when a connection goes back to the pool, so these are kept as fixed texts:
+# the per-connection statement cache parses and plans each once per connection.
+BIKE_EXISTS_SQL = "SELECT id FROM bikes WHERE id = $1"
+INSERT_BIKE_NOTE_SQL = """
+    INSERT INTO bike_notes (bike_id, user_id, note, author, created_at)
+    VALUES ($1, $2, $3, $4, CURRENT_TIMESTAMP)
+    RETURNING *
+"""
+DELETE_BIKE_NOTE_SQL = "DELETE FROM bike_notes WHERE id = $1 AND user_id = $2 RETURNING id"
+# Find-or-create in one round-trip: the insert only fires when the user has no
+# bike for the tracker yet, built from the user's alerts for that tracker
+BIKE_ID_BY_TRACKER_SQL = """
+    WITH existing AS (
+        SELECT id FROM bikes WHERE user_id = $1 AND tracker_name = $2
+    ),
+    ins AS (
+        INSERT INTO bikes (user_id, tracker_name, device_serial, latest_alert_at)
+        SELECT $1, tracker_name, MAX(device_serial), MAX(created_at)
+        FROM tracker_alerts
+        WHERE user_id = $1 AND tracker_name = $2 AND NOT EXISTS (SELECT 1 FROM existing)
+        GROUP BY tracker_name
+        ON CONFLICT (user_id, tracker_name) 
+        DO UPDATE SET 
+            latest_alert_at = EXCLUDED.latest_alert_at,
+            device_serial = EXCLUDED.device_serial
+        RETURNING id
+    )
+    SELECT id FROM existing
+    UNION ALL
+    SELECT id FROM ins
+    LIMIT 1
+"""
+
+
+def resolve_pool_sizes() -> tuple:
+    """(min, max) pool size, 10..50 unless DB_POOL_MIN/MAX_SIZE override"""
+    max_size = int(os.environ.get("DB_POOL_MAX_SIZE") or 50)
+    min_size = int(os.environ.get("DB_POOL_MIN_SIZE") or 10)
+    return min(min_size, max_size), max_size
+
 
 @app.on_event("startup")
 async def startup_db():
-    global db_pool, background_task
+    global db_pool, background_task, imap_reaper_task
     database_url = os.environ.get('DATABASE_URL')
     if not database_url:
         raise RuntimeError("DATABASE_URL environment variable not set")
     
     database_url = database_url.strip("'\"")
     
-    # Disable statement caching to avoid InvalidCachedStatementError with Neon
+    min_size, max_size = resolve_pool_sizes()
     db_pool = await asyncpg.create_pool(
         database_url, 
-        min_size=2, 
-        max_size=10,
-        statement_cache_size=0  # Disable statement caching
+        min_size=min_size, 
+        max_size=max_size,
+        max_inactive_connection_lifetime=DB_MAX_INACTIVE_CONNECTION_SECONDS,
+        command_timeout=DB_COMMAND_TIMEOUT_SECONDS,
+        statement_cache_size=resolve_statement_cache_size(database_url)
+        # No json/jsonb type codec on purpose: asyncpg hands json back as text,
+        # which the json_build_object endpoints pass through without decoding
     )
-    logger.info("Database pool created")
+    logger.info(f"Database pool created (min={min_size}, max={max_size})")
     
     async with db_pool.acquire() as conn:
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id VARCHAR PRIMARY KEY,
-                username VARCHAR UNIQUE NOT NULL,
-                email VARCHAR UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                full_name VARCHAR,
-                gmail_email VARCHAR,
-                gmail_app_password VARCHAR,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tracker_alerts (
-                id SERIAL PRIMARY KEY,
-                user_id VARCHAR NOT NULL,
-                email_id VARCHAR NOT NULL,
-                alert_type VARCHAR,
-                alert_time VARCHAR,
-                location VARCHAR,
-                latitude VARCHAR,
-                longitude VARCHAR,
-                device_serial VARCHAR,
-                tracker_name VARCHAR,
-                account_name VARCHAR,
-                raw_body TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status VARCHAR DEFAULT 'New',
-                acknowledged BOOLEAN DEFAULT FALSE,
-                acknowledged_at TIMESTAMP,
-                acknowledged_by VARCHAR,
-                notes TEXT,
-                assigned_to VARCHAR,
-                favorite BOOLEAN DEFAULT FALSE,
-                UNIQUE(user_id, email_id)
-            )
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sync_checkpoints (
-                id SERIAL PRIMARY KEY,
-                user_id VARCHAR NOT NULL UNIQUE,
-                last_email_id VARCHAR,
-                last_sync_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS bikes (
-                id SERIAL PRIMARY KEY,
-                user_id VARCHAR NOT NULL,
-                tracker_name VARCHAR NOT NULL,
-                device_serial VARCHAR,
-                latest_alert_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(user_id, tracker_name)
-            )
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_bikes_user_id ON bikes(user_id)
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_bikes_tracker_name ON bikes(tracker_name)
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS bike_notes (
-                id SERIAL PRIMARY KEY,
-                bike_id INTEGER NOT NULL,
-                user_id VARCHAR NOT NULL,
-                note TEXT NOT NULL,
-                author VARCHAR NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (bike_id) REFERENCES bikes(id) ON DELETE CASCADE
-            )
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_bike_notes_bike_id ON bike_notes(bike_id)
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS email_sync_runs (
-                id SERIAL PRIMARY KEY,
-                user_id VARCHAR NOT NULL,
-                started_at TIMESTAMP NOT NULL,
-                completed_at TIMESTAMP NOT NULL,
-                source VARCHAR NOT NULL,
-                status VARCHAR NOT NULL,
-                emails_read INTEGER DEFAULT 0,
-                emails_new INTEGER DEFAULT 0,
-                error_summary TEXT,
-                log_json TEXT
-            )
-            """
-        )
-        
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS refresh_tokens (
-                id SERIAL PRIMARY KEY,
-                user_id VARCHAR NOT NULL,
-                token_hash VARCHAR NOT NULL,
-                expires_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-            """
-        )
-        
-        # Add sync configuration and role columns if they don't exist
-        try:
-            await conn.execute(
-                """
-                ALTER TABLE users 
-                ADD COLUMN IF NOT EXISTS sync_interval_minutes INTEGER DEFAULT 10,
-                ADD COLUMN IF NOT EXISTS email_limit_per_sync INTEGER DEFAULT 100,
-                ADD COLUMN IF NOT EXISTS role VARCHAR DEFAULT 'admin'
-                """
-            )
-        except Exception as e:
-            logger.warning(f"Error adding config columns (may already exist): {str(e)}")
+        # Sent as one simple-query batch: a single round-trip and a single
+        # implicit transaction for the whole schema
+        await conn.execute(SCHEMA_SQL, timeout=DB_SCHEMA_TIMEOUT_SECONDS)
         
         admin_exists = await conn.fetchval(
             "SELECT COUNT(*) FROM users WHERE username = 'admin'"
@@ -591,6 +830,8 @@ async def startup_db():
     
     background_task = asyncio.create_task(auto_sync_background())
     logger.info("Background sync task started (1 hour interval, 30 email limit)")
+    
+    imap_reaper_task = asyncio.create_task(imap_reaper_background())
 
 async def auto_sync_background():
     """Background task to automatically sync alerts every 1 hour for all users with 30 email limit"""
@@ -602,13 +843,14 @@ async def auto_sync_background():
                 users = await conn.fetch(
                     "SELECT * FROM users WHERE gmail_email IS NOT NULL AND gmail_app_password IS NOT NULL"
                 )
-                
-                for user in users:
-                    try:
-                        new_count = await sync_emails_background(dict(user), limit=30)
-                        logger.info(f"Background sync completed for {user['username']}: {new_count} new emails processed")
-                    except Exception as e:
-                        logger.error(f"Background sync error for {user['username']}: {str(e)}")
+            
+            # Each sync acquires its own connections; don't hold this one across them
+            for user in users:
+                try:
+                    new_count = await sync_emails_background(user, limit=30)
+                    logger.info(f"Background sync completed for {user['username']}: {new_count} new emails processed")
+                except Exception as e:
+                    logger.error(f"Background sync error for {user['username']}: {str(e)}")
                     
         except asyncio.CancelledError:
             logger.info("Background sync task cancelled")
@@ -618,7 +860,17 @@ async def auto_sync_background():
 
 @app.on_event("shutdown")
 async def shutdown_db():
-    global db_pool, background_task
+    if imap_reaper_task:
+        imap_reaper_task.cancel()
+        try:
+            await imap_reaper_task
+        except asyncio.CancelledError:
+            pass
+    await asyncio.gather(*[
+        run_imap(close_imap, imap) for imap, _, _ in imap_pool.values()
+    ])
+    imap_pool.clear()
+    imap_executor.shutdown(wait=False)
     if background_task:
         background_task.cancel()
         try:
@@ -687,11 +939,14 @@ async def login(request: LoginRequest, response: Response):
             request.username
         )
         
+        password_hash = user['password_hash'] if user else _DUMMY_HASH
+        password_ok = await asyncio.to_thread(pwd_context.verify, request.password, password_hash)
+        
         if not user:
             logger.warning(f"Login attempt for non-existent user: {request.username}")
             raise HTTPException(status_code=401, detail="Invalid credentials")
         
-        if not pwd_context.verify(request.password, user['password_hash']):
+        if not password_ok:
             logger.warning(f"Invalid password for user: {request.username}")
             raise HTTPException(status_code=401, detail="Invalid credentials")
         
@@ -705,14 +960,13 @@ async def login(request: LoginRequest, response: Response):
         
         logger.info(f"User logged in: {request.username}")
         
-        user_dict = dict(user)
         return {
             "user": {
-                "id": user_dict['id'],
-                "username": user_dict['username'],
-                "email": user_dict['email'],
-                "full_name": user_dict['full_name'],
-                "role": user_dict.get('role', 'admin')
+                "id": user['id'],
+                "username": user['username'],
+                "email": user['email'],
+                "full_name": user['full_name'],
+                "role": user.get('role', 'admin')
             }
         }
 
@@ -752,14 +1006,13 @@ async def refresh_token_endpoint(req: Request, response: Response):
     set_auth_cookie(response, "access_token", access_token, ACCESS_TOKEN_EXPIRE_MINUTES * 60)
     set_auth_cookie(response, "refresh_token", new_refresh_token, REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60)
     
-    user_dict = dict(user)
     return {
         "user": {
-            "id": user_dict['id'],
-            "username": user_dict['username'],
-            "email": user_dict['email'],
-            "full_name": user_dict['full_name'],
-            "role": user_dict.get('role', 'admin')
+            "id": user['id'],
+            "username": user['username'],
+            "email": user['email'],
+            "full_name": user['full_name'],
+            "role": user.get('role', 'admin')
         }
     }
 
@@ -915,14 +1168,59 @@ async def delete_user(user_id: str, admin_user: dict = Depends(get_admin_user)):
         
         if result == "DELETE 0":
             raise HTTPException(status_code=404, detail="User not found")
-        
-        return {"success": True, "message": "User deleted successfully"}
+    
+    invalidate_user_caches(user_id)
+    email_id_filters.pop(user_id, None)
+    await drop_imap_session(user_id)
+    
+    return {"success": True, "message": "User deleted successfully"}
+
+
+IMAP_PIPELINE_DEPTH = 8
+IMAP_LITERAL_RE = re.compile(rb'\{(\d+)\}\r?\n$')
+
+
+class PipelinedIMAP(imaplib.IMAP4_SSL):
+    """IMAP4_SSL client that keeps several FETCH commands in flight (RFC 3501 5.5)"""
+    
+    def fetch_pipelined(self, message_sets: List[bytes], depth: int = IMAP_PIPELINE_DEPTH) -> dict:
+        """Write up to `depth` tagged FETCHes before reading any reply - returns {email_id: raw message}"""
+        messages = {}
+        for i in range(0, len(message_sets), depth):
+            pending = {}
+            commands = b""
+            for message_set in message_sets[i:i + depth]:
+                tag = self._new_tag()
+                self.tagged_commands.pop(tag, None)
+                pending[tag] = message_set
+                commands += tag + b" FETCH " + message_set + b" (RFC822)\r\n"
+            self.send(commands)
+            
+            while pending:
+                line = self.readline()
+                if not line:
+                    raise self.abort("socket error: EOF")
+                
+                if line.startswith(b"* "):
+                    # Untagged "* <id> FETCH (RFC822 {<size>}" followed by the literal
+                    literal = IMAP_LITERAL_RE.search(line)
+                    if literal and b" FETCH " in line:
+                        data = self.read(int(literal.group(1)))
+                        self.readline()
+                        messages[line.split(None, 2)[1].decode()] = data
+                    continue
+                
+                tag, status = line.split(None, 2)[:2]
+                message_set = pending.pop(tag, None)
+                if message_set is not None and status != b"OK":
+                    logger.error(f"Error fetching emails {message_set.decode()}: {line.decode(errors='ignore').strip()}")
+        return messages
 
 
 def connect_imap(email_addr: str, app_password: str):
     """Connect to Gmail via IMAP"""
     try:
-        imap = imaplib.IMAP4_SSL("imap.gmail.com")
+        imap = PipelinedIMAP("imap.gmail.com")
         imap.login(email_addr, app_password)
         return imap
     except Exception as e:
@@ -930,6 +1228,104 @@ def connect_imap(email_addr: str, app_password: str):
         raise HTTPException(status_code=400, detail=f"Failed to connect to Gmail: {str(e)}")
 
 
+# Gmail drops idle IMAP sessions after ~30 minutes
+IMAP_IDLE_TIMEOUT_SECONDS = 25 * 60
+IMAP_REAPER_INTERVAL_SECONDS = 60
+
+# user_id -> (imap, (email, app_password), last_used). Only touched from the
+# event loop without awaiting in between, so checkout/checkin need no lock;
+# the blocking imaplib calls themselves all run in worker threads.
+imap_pool: dict = {}
+
+# imaplib blocks, so its calls run in threads - but on their own bounded
+# executor, leaving the loop's default executor free for password hashing
+IMAP_EXECUTOR_WORKERS = int(os.environ.get("IMAP_EXECUTOR_WORKERS") or 16)
+imap_executor = ThreadPoolExecutor(max_workers=IMAP_EXECUTOR_WORKERS, thread_name_prefix="imap")
+
+
+async def run_imap(func, *args):
+    """Run a blocking IMAP call on the dedicated IMAP executor"""
+    return await asyncio.get_running_loop().run_in_executor(imap_executor, partial(func, *args))
+
+
+def close_imap(imap):
+    """Log out of an IMAP connection, ignoring errors from dead sockets"""
+    try:
+        imap.logout()
+    except Exception:
+        pass
+
+
+def imap_is_alive(imap) -> bool:
+    """Validate a cached IMAP connection with a NOOP"""
+    try:
+        return imap.noop()[0] == "OK"
+    except Exception:
+        return False
+
+
+@asynccontextmanager
+async def imap_session(user_id: str, email_addr: str, app_password: str):
+    """Check out the user's cached IMAP connection (or open one) and return it to the pool afterwards"""
+    credentials = (email_addr, app_password)
+    imap = None
+    entry = imap_pool.pop(user_id, None)
+    if entry:
+        cached, cached_credentials, last_used = entry
+        if (
+            cached_credentials == credentials
+            and time.monotonic() - last_used < IMAP_IDLE_TIMEOUT_SECONDS
+            and await run_imap(imap_is_alive, cached)
+        ):
+            imap = cached
+        else:
+            await run_imap(close_imap, cached)
+    
+    if imap is None:
+        imap = await run_imap(connect_imap, email_addr, app_password)
+    
+    try:
+        yield imap
+    except BaseException:
+        # The connection may be mid-response; never hand it to the next sync
+        await run_imap(close_imap, imap)
+        raise
+    
+    # A concurrent sync for the same user may have checked one in meanwhile; keep ours
+    previous = imap_pool.pop(user_id, None)
+    imap_pool[user_id] = (imap, credentials, time.monotonic())
+    if previous:
+        await run_imap(close_imap, previous[0])
+
+
+async def drop_imap_session(user_id: str):
+    """Log out and forget the user's pooled IMAP connection, if there is one"""
+    entry = imap_pool.pop(user_id, None)
+    if entry:
+        await run_imap(close_imap, entry[0])
+
+
+async def imap_reaper_background():
+    """Close pooled IMAP connections that have been idle too long"""
+    while True:
+        try:
+            await asyncio.sleep(IMAP_REAPER_INTERVAL_SECONDS)
+            
+            now = time.monotonic()
+            expired = [
+                user_id for user_id, (_, _, last_used) in imap_pool.items()
+                if now - last_used >= IMAP_IDLE_TIMEOUT_SECONDS
+            ]
+            for user_id in expired:
+                await run_imap(close_imap, imap_pool.pop(user_id)[0])
+                
+        except asyncio.CancelledError:
+            logger.info("IMAP reaper task cancelled")
+            break
+        except Exception as e:
+            logger.error(f"IMAP reaper error: {str(e)}")
+
+
 def decode_email_subject(subject):
     """Decode email subject"""
     if subject:
@@ -966,11 +1362,96 @@ def get_email_body(msg):
     return body
 
 
+def search_alert_emails(imap, since: Optional[datetime] = None) -> List[bytes]:
+    """Select INBOX and return the message numbers of tracker alert emails, optionally only those since a date"""
+    imap.select("INBOX")
+    criteria = 'FROM "alerts-no-reply@tracking-update.com"'
+    if since:
+        criteria = f'({criteria} SINCE {since.strftime("%d-%b-%Y")})'
+    _, message_numbers = imap.search(None, criteria)
+    return message_numbers[0].split()
+
+
+IMAP_FETCH_BATCH_SIZE = 100
+
+
+def fetch_email_bodies(imap, email_ids: List[bytes]) -> List[tuple]:
+    """Fetch emails with pipelined, ranged FETCH commands - returns (email_id, body) tuples in input order"""
+    message_sets = [
+        b",".join(email_ids[i:i + IMAP_FETCH_BATCH_SIZE])
+        for i in range(0, len(email_ids), IMAP_FETCH_BATCH_SIZE)
+    ]
+    try:
+        messages = imap.fetch_pipelined(message_sets)
+    except Exception as e:
+        # Re-raise so imap_session discards the connection and the sync reports the failure
+        logger.error(f"Error fetching emails: {str(e)}")
+        raise
+    
+    email_data_list = []
+    for email_id in email_ids:
+        email_id_str = email_id.decode()
+        raw = messages.get(email_id_str)
+        if raw is None:
+            continue
+        try:
+            msg = email.message_from_bytes(raw)
+            email_data_list.append((email_id_str, get_email_body(msg)))
+        except Exception as e:
+            logger.error(f"Error fetching email {email_id_str}: {str(e)}")
+    return email_data_list
+
+
+# Gmail allows 15 concurrent IMAP connections per account; stay well under it
+IMAP_PARALLEL_CONNECTIONS = 4
+IMAP_PARALLEL_MIN_MESSAGES = 400
+
+
+def open_inbox(email_addr: str, app_password: str):
+    """Open a standalone IMAP connection with INBOX selected"""
+    imap = connect_imap(email_addr, app_password)
+    imap.select("INBOX")
+    return imap
+
+
+async def fetch_email_bodies_parallel(imap, email_addr: str, app_password: str, email_ids: List[bytes]) -> List[tuple]:
+    """Fetch bodies for large id lists over several IMAP connections, one contiguous shard each"""
+    if len(email_ids) < IMAP_PARALLEL_MIN_MESSAGES:
+        return await run_imap(fetch_email_bodies, imap, email_ids)
+    
+    shard_size = math.ceil(len(email_ids) / IMAP_PARALLEL_CONNECTIONS)
+    shards = [email_ids[i:i + shard_size] for i in range(0, len(email_ids), shard_size)]
+    
+    # The session's own connection takes the first shard; the rest get short-lived ones
+    opened = await asyncio.gather(
+        *[run_imap(open_inbox, email_addr, app_password) for _ in shards[1:]],
+        return_exceptions=True
+    )
+    extra = [conn for conn in opened if not isinstance(conn, BaseException)]
+    if len(extra) < len(opened):
+        logger.warning("Could not open extra IMAP connections, fetching on one connection")
+        await asyncio.gather(*[run_imap(close_imap, conn) for conn in extra])
+        return await run_imap(fetch_email_bodies, imap, email_ids)
+    
+    try:
+        results = await asyncio.gather(
+            *[
+                run_imap(fetch_email_bodies, conn, shard)
+                for conn, shard in zip([imap] + extra, shards)
+            ]
+        )
+    finally:
+        await asyncio.gather(*[run_imap(close_imap, conn) for conn in extra])
+    
+    return [email_data for shard in results for email_data in shard]
+
+
 @api_router.post("/gmail/connect")
 async def connect_gmail(request: ConnectGmailRequest, current_user: dict = Depends(get_current_user)):
     """Connect Gmail account via IMAP"""
-    imap = connect_imap(request.email, request.app_password)
-    imap.logout()
+    # Validates the credentials and leaves the connection pooled for the first sync
+    async with imap_session(current_user['id'], request.email, request.app_password):
+        pass
     
     async with db_pool.acquire() as conn:
         await conn.execute(
@@ -981,6 +1462,7 @@ async def connect_gmail(request: ConnectGmailRequest, current_user: dict = Depen
             """,
             current_user['id'], request.email, request.app_password
         )
+    invalidate_user_caches(current_user['id'])
     
     return {"success": True, "message": "Gmail connected successfully"}
 
@@ -998,6 +1480,10 @@ async def disconnect_gmail(current_user: dict = Depends(get_current_user)):
             current_user['id']
         )
     
+    invalidate_user_caches(current_user['id'])
+    # The pooled session is still logged in with the revoked credentials
+    await drop_imap_session(current_user['id'])
+    
     return {"success": True}
 
 
@@ -1014,7 +1500,7 @@ async def manual_sync(current_user: dict = Depends(get_current_user)):
         if not user or not user.get('gmail_email') or not user.get('gmail_app_password'):
             raise HTTPException(status_code=400, detail="Gmail not configured")
         
-        new_count = await sync_emails_background(dict(user), limit=100)
+        new_count = await sync_emails_background(user, limit=100)
         
         return {
             "success": True, 
@@ -1040,61 +1526,45 @@ async def sync_progressive(current_user: dict = Depends(get_current_user)):
         if not user or not user.get('gmail_email') or not user.get('gmail_app_password'):
             raise HTTPException(status_code=400, detail="Gmail not configured")
         
-        imap = connect_imap(user['gmail_email'], user['gmail_app_password'])
-        imap.select("INBOX")
-        
-        _, message_numbers = imap.search(None, 'FROM "alerts-no-reply@tracking-update.com"')
-        email_ids = message_numbers[0].split()
-        total_emails = len(email_ids)
-        
-        async with db_pool.acquire() as conn:
-            existing_ids = await conn.fetch(
-                "SELECT email_id FROM tracker_alerts WHERE user_id = $1",
-                user['id']
-            )
-            existing_set = {row['email_id'] for row in existing_ids}
+        async with imap_session(user['id'], user['gmail_email'], user['gmail_app_password']) as imap:
+            email_ids = await run_imap(search_alert_emails, imap)
+            total_emails = len(email_ids)
+            
+            async with db_pool.acquire() as conn:
+                existing_set = await fetch_existing_email_ids(conn, user['id'], email_ids)
             
             # Process only first 10 new emails
-            email_data_list = []
+            to_fetch = []
             processed_count = 0
             
             for email_id in email_ids:
-                email_id_str = email_id.decode()
-                
-                if email_id_str in existing_set:
+                if email_id.decode() in existing_set:
                     processed_count += 1
                     continue
                 
-                if len(email_data_list) >= 10:
+                if len(to_fetch) >= 10:
                     break
                 
-                try:
-                    _, msg_data = imap.fetch(email_id, "(RFC822)")
-                    email_body = msg_data[0][1]
-                    msg = email.message_from_bytes(email_body)
-                    body = get_email_body(msg)
-                    email_data_list.append((email_id_str, body))
-                except Exception as e:
-                    logger.error(f"Error fetching email {email_id_str}: {str(e)}")
-            
-            imap.logout()
-            
-            new_processed = 0
-            if email_data_list:
-                new_processed = await process_email_batch(email_data_list, user['id'])
-                processed_count += new_processed
-            
-            remaining = total_emails - processed_count
+                to_fetch.append(email_id)
             
-            return {
-                "success": True,
-                "total": total_emails,
-                "processed": processed_count,
-                "remaining": remaining,
-                "batch_size": len(email_data_list),
-                "new_alerts": new_processed,
-                "completed": remaining == 0
-            }
+            email_data_list = await run_imap(fetch_email_bodies, imap, to_fetch)
+        
+        new_processed = 0
+        if email_data_list:
+            new_processed = await process_email_batch(email_data_list, user['id'])
+            processed_count += new_processed
+        
+        remaining = total_emails - processed_count
+        
+        return {
+            "success": True,
+            "total": total_emails,
+            "processed": processed_count,
+            "remaining": remaining,
+            "batch_size": len(email_data_list),
+            "new_alerts": new_processed,
+            "completed": remaining == 0
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -1115,66 +1585,46 @@ async def sync_today_emails(current_user: dict = Depends(get_current_user)):
         if not user or not user.get('gmail_email') or not user.get('gmail_app_password'):
             raise HTTPException(status_code=400, detail="Gmail not configured")
         
-        imap = connect_imap(user['gmail_email'], user['gmail_app_password'])
-        imap.select("INBOX")
-        
-        _, message_numbers = imap.search(None, 'FROM "alerts-no-reply@tracking-update.com"')
-        email_ids = message_numbers[0].split()
-        
-        async with db_pool.acquire() as conn:
-            existing_ids = await conn.fetch(
-                "SELECT email_id FROM tracker_alerts WHERE user_id = $1",
-                user['id']
-            )
-            existing_set = {row['email_id'] for row in existing_ids}
-            
-            email_data_list = []
-            for email_id in email_ids:
-                email_id_str = email_id.decode()
-                
-                if email_id_str in existing_set:
-                    continue
-                
-                try:
-                    _, msg_data = imap.fetch(email_id, "(RFC822)")
-                    email_body = msg_data[0][1]
-                    msg = email.message_from_bytes(email_body)
-                    body = get_email_body(msg)
-                    email_data_list.append((email_id_str, body))
-                except Exception as e:
-                    logger.error(f"Error fetching email {email_id_str}: {str(e)}")
+        async with imap_session(user['id'], user['gmail_email'], user['gmail_app_password']) as imap:
+            email_ids = await run_imap(search_alert_emails, imap)
             
-            imap.logout()
-            
-            if not email_data_list:
-                return {
-                    "success": True,
-                    "message": f"No new emails from today ({len(email_ids)} already processed)"
-                }
-            
-            batch_size = 10
-            total_processed = 0
-            
-            for i in range(0, len(email_data_list), batch_size):
-                batch = email_data_list[i:i + batch_size]
-                processed = await process_email_batch(batch, user['id'])
-                total_processed += processed
-            
-            if email_data_list and email_ids:
-                await conn.execute(
-                    """
-                    INSERT INTO sync_checkpoints (user_id, last_email_id, last_sync_at)
-                    VALUES ($1, $2, CURRENT_TIMESTAMP)
-                    ON CONFLICT (user_id) 
-                    DO UPDATE SET last_email_id = $2, last_sync_at = CURRENT_TIMESTAMP
-                    """,
-                    user['id'], email_ids[-1].decode()
-                )
+            async with db_pool.acquire() as conn:
+                existing_set = await fetch_existing_email_ids(conn, user['id'], email_ids)
             
+            to_fetch = [email_id for email_id in email_ids if email_id.decode() not in existing_set]
+            email_data_list = await fetch_email_bodies_parallel(
+                imap, user['gmail_email'], user['gmail_app_password'], to_fetch
+            )
+        
+        if not email_data_list:
             return {
                 "success": True,
-                "message": f"Full sync completed: {total_processed} new emails processed (total found: {len(email_ids)})"
+                "message": f"No new emails from today ({len(email_ids)} already processed)"
             }
+        
+        total_processed = 0
+        
+        for i in range(0, len(email_data_list), ALERT_INSERT_BATCH_SIZE):
+            batch = email_data_list[i:i + ALERT_INSERT_BATCH_SIZE]
+            processed = await process_email_batch(batch, user['id'])
+            total_processed += processed
+        
+        async with db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO sync_checkpoints (user_id, last_email_id, last_sync_at)
+                VALUES ($1, $2, CURRENT_TIMESTAMP)
+                ON CONFLICT (user_id) 
+                DO UPDATE SET last_email_id = $2, last_sync_at = CURRENT_TIMESTAMP
+                """,
+                user['id'], email_ids[-1].decode()
+            )
+        invalidate_user_caches(user['id'])
+        
+        return {
+            "success": True,
+            "message": f"Full sync completed: {total_processed} new emails processed (total found: {len(email_ids)})"
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -1182,38 +1632,200 @@ async def sync_today_emails(current_user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=500, detail=f"Today sync failed: {str(e)}")
 
 
+class CoalescingCache:
+    """Short-lived per-user response cache; concurrent misses share one computation"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.inflight = {}
+
+    async def get(self, key: tuple, compute):
+        if key in self.cache:
+            return self.cache[key]
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(compute())
+            self.inflight[key] = task
+            task.add_done_callback(lambda t: self._store(key, t))
+        # Shield so one disconnecting client doesn't cancel everyone's result
+        return await asyncio.shield(task)
+
+    def _store(self, key: tuple, task: asyncio.Task):
+        # An invalidation while the task ran drops it from inflight; don't cache it then
+        if self.inflight.get(key) is not task:
+            return
+        del self.inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.cache[key] = task.result()
+
+    def invalidate_user(self, user_id: str):
+        for key in [k for k in self.cache.keys() if k[0] == user_id]:
+            self.cache.pop(key, None)
+        for key in [k for k in self.inflight if k[0] == user_id]:
+            del self.inflight[key]
+
+
+STATS_CACHE_TTL_SECONDS = 5
+stats_cache = CoalescingCache(maxsize=1024, ttl=STATS_CACHE_TTL_SECONDS)
+STATUS_CACHE_TTL_SECONDS = 30
+status_cache = CoalescingCache(maxsize=1024, ttl=STATUS_CACHE_TTL_SECONDS)
+
+
+def invalidate_user_caches(user_id: str):
+    """Drop a user's cached stats and status after their alerts or sync state change"""
+    stats_cache.invalidate_user(user_id)
+    status_cache.invalidate_user(user_id)
+
+
+# Each batch is one unnest() INSERT, so large batches cost a single round-trip
+ALERT_INSERT_BATCH_SIZE = 500
+
+
+# One round-trip per batch: insert the alerts and fold the new rows into
+# bikes (grouped, since ON CONFLICT can't touch the same bike twice).
+INSERT_ALERT_BATCH_SQL = """
+    WITH ins AS (
+        INSERT INTO tracker_alerts (
+            user_id, email_id, alert_type, alert_time, location,
+            latitude, longitude, device_serial, tracker_name,
+            account_name, raw_body
+        )
+        SELECT $1, * FROM unnest(
+            $2::varchar[], $3::varchar[], $4::varchar[], $5::varchar[],
+            $6::varchar[], $7::varchar[], $8::varchar[], $9::varchar[],
+            $10::varchar[], $11::text[]
+        )
+        ON CONFLICT (user_id, email_id) DO NOTHING
+        RETURNING user_id, tracker_name, device_serial, created_at
+    ),
+    upserted AS (
+        INSERT INTO bikes (user_id, tracker_name, device_serial, latest_alert_at)
+        SELECT user_id, tracker_name, MAX(device_serial), MAX(created_at)
+        FROM ins
+        WHERE tracker_name <> ''
+        GROUP BY user_id, tracker_name
+        ON CONFLICT (user_id, tracker_name) DO UPDATE SET
+            latest_alert_at = GREATEST(bikes.latest_alert_at, EXCLUDED.latest_alert_at),
+            device_serial = COALESCE(bikes.device_serial, EXCLUDED.device_serial)
+    )
+    SELECT COUNT(*) FROM ins
+"""
+# Errors one bad row can raise: server-side (encoding, oversized value,
+# constraint) or asyncpg's client-side encoding errors, which are ValueErrors.
+# They abort the whole batch statement, so the batch is retried row by row
+ALERT_ROW_ERRORS = (asyncpg.PostgresError, ValueError)
+
+
+async def insert_alerts_one_by_one(conn, user_id: str, columns: list) -> tuple:
+    """Insert a failed batch row by row, logging and skipping the rows that fail - returns (inserted, stored ids)"""
+    inserted = 0
+    stored_ids = []
+    for row in zip(*columns):
+        try:
+            inserted += await conn.fetchval(INSERT_ALERT_BATCH_SQL, user_id, *[[value] for value in row])
+        except ALERT_ROW_ERRORS as e:
+            if conn.is_closed():
+                raise
+            logger.error(f"Skipping email {row[0]}: {str(e)}")
+            continue
+        stored_ids.append(row[0])
+    return inserted, stored_ids
+
+
 async def process_email_batch(email_data_list: List[tuple], user_id: str):
-    """Process a batch of emails in parallel with individual connections"""
-    async def process_single_email(email_id_str, body):
+    """Insert a batch of emails and upsert their bikes in a single statement"""
+    columns = [[] for _ in range(10)]
+    for email_id_str, body in email_data_list:
         try:
             parsed = parse_tracker_email(body)
             category = categorize_alert(parsed["alert_type"])
-            
-            async with db_pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO tracker_alerts (
-                        user_id, email_id, alert_type, alert_time, location, 
-                        latitude, longitude, device_serial, tracker_name, 
-                        account_name, raw_body
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                    ON CONFLICT (user_id, email_id) DO NOTHING
-                    """,
-                    user_id, email_id_str, category, 
-                    parsed["time"], parsed["location"], 
-                    parsed["latitude"], parsed["longitude"],
-                    parsed["device_serial"], parsed["tracker_name"],
-                    parsed["account_name"], body[:500]
-                )
-            return True
         except Exception as e:
             logger.error(f"Error processing email {email_id_str}: {str(e)}")
-            return False
+            continue
+
+        row = (
+            email_id_str, category,
+            parsed["time"], parsed["location"],
+            parsed["latitude"], parsed["longitude"],
+            parsed["device_serial"], parsed["tracker_name"],
+            parsed["account_name"], body[:500]
+        )
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    if not columns[0]:
+        return 0
+
+    async with db_pool.acquire() as conn:
+        try:
+            inserted = await conn.fetchval(INSERT_ALERT_BATCH_SQL, user_id, *columns)
+            stored_ids = columns[0]
+        except ALERT_ROW_ERRORS as e:
+            # Without this, one bad email would fail every sync of the batch
+            # and the checkpoint would never move past it
+            logger.warning(f"Alert batch insert failed, retrying {len(columns[0])} emails one by one: {str(e)}")
+            inserted, stored_ids = await insert_alerts_one_by_one(conn, user_id, columns)
+    # Every stored id is in the table now, whether inserted here or already present
+    remember_email_ids(user_id, stored_ids)
+    if inserted:
+        invalidate_user_caches(user_id)
+    return inserted
+
+
+UNREAD_PREDICATE = "(acknowledged IS NULL OR acknowledged = FALSE)"
+
+
+async def fetch_alert_counts(conn, where_clause: str, params: list, unread_only: bool = False):
+    """Alert counters for the stats panel in a single scan of tracker_alerts
     
-    tasks = [process_single_email(email_id, body) for email_id, body in email_data_list]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    return sum(1 for r in results if r is True)
+    where_clause must not filter on acknowledged: unread/acknowledged are always
+    counted over it, while unread_only scopes total and the category counters.
+    alert_type holds the canonical categorize_alert() value, so the category
+    checks here and below are plain equality and can use the indexes.
+    """
+    scope = UNREAD_PREDICATE if unread_only else "TRUE"
+    return await conn.fetchrow(
+        f"""
+        SELECT
+            COUNT(*) FILTER (WHERE {scope}) AS total,
+            COUNT(*) FILTER (WHERE {UNREAD_PREDICATE}) AS unread,
+            COUNT(*) FILTER (WHERE acknowledged = TRUE) AS acknowledged,
+            COUNT(*) FILTER (WHERE {scope} AND alert_type = 'Over-turn') AS over_turn,
+            COUNT(*) FILTER (WHERE {scope} AND alert_type = 'No Communication') AS no_communication,
+            COUNT(*) FILTER (WHERE {scope} AND alert_type = 'Heavy Impact') AS heavy_impact
+        FROM tracker_alerts
+        {where_clause}
+        """,
+        *params
+    )
+
+
+async def fetch_bike_priority_counts(conn, where_clause: str, params: list):
+    """Per-bike priority counters: Light Sensor + Over-turn bikes are heavy impact,
+    otherwise any Over-turn, Heavy Impact or No Communication alert is high priority"""
+    return await conn.fetchrow(
+        f"""
+        WITH per_bike AS (
+            SELECT
+                tracker_name,
+                COALESCE(bool_or(alert_type = 'Light Sensor'), FALSE) AS light_sensor,
+                COALESCE(bool_or(alert_type = 'Over-turn'), FALSE) AS over_turn,
+                COALESCE(bool_or(alert_type = 'Heavy Impact'), FALSE) AS heavy_impact,
+                COALESCE(bool_or(alert_type = 'No Communication'), FALSE) AS no_communication
+            FROM tracker_alerts
+            {where_clause}
+            GROUP BY tracker_name
+        )
+        SELECT
+            COUNT(*) FILTER (WHERE light_sensor AND over_turn) AS heavy_impact_bikes,
+            COUNT(*) FILTER (
+                WHERE NOT (light_sensor AND over_turn)
+                AND (over_turn OR heavy_impact OR no_communication)
+            ) AS high_priority
+        FROM per_bike
+        """,
+        *params
+    )
 
 
 @api_router.get("/alerts/categories")
@@ -1246,6 +1858,31 @@ async def get_categories(current_user: dict = Depends(get_current_user)):
         }
 
 
+# Columns the alert list and bike history responses use; raw_body and the
+# sync bookkeeping columns stay in the database
+ALERT_LIST_FIELDS = (
+    "id", "alert_type", "alert_time", "location", "latitude", "longitude",
+    "device_serial", "tracker_name", "account_name", "status", "acknowledged",
+    "acknowledged_at", "acknowledged_by", "notes", "assigned_to", "favorite",
+    "created_at"
+)
+ALERT_LIST_COLUMNS = ", ".join(ALERT_LIST_FIELDS)
+
+
+def encode_alert_cursor(alert) -> str:
+    """Keyset cursor for the row after which the next page starts"""
+    return f"{alert['created_at'].isoformat()}_{alert['id']}"
+
+
+def decode_alert_cursor(cursor: str) -> tuple:
+    """Parse a `<created_at iso>_<id>` cursor into (created_at, id)"""
+    try:
+        created_at, alert_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), int(alert_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @api_router.get("/alerts/list")
 async def list_alerts(
     category: Optional[str] = Query(None), 
@@ -1253,6 +1890,7 @@ async def list_alerts(
     limit: int = Query(5000, ge=1, le=10000),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     current_user: dict = Depends(get_current_user)
 ):
     """Get tracker alerts with pagination and optional category filter - SHARED DATABASE"""
@@ -1267,38 +1905,45 @@ async def list_alerts(
         params = []
         
         # Only filter by acknowledged if no date filter is applied
-        if not start_date and not end_date:
-            where_clause += " AND (acknowledged IS NULL OR acknowledged = FALSE)"
+        unread_only = not start_date and not end_date
         
         if category and category != "All":
             where_clause += f" AND alert_type = ${len(params) + 1}"
             params.append(category)
         
         if start_date:
-            from datetime import datetime
-            start_datetime = datetime.strptime(start_date, "%Y-%m-%d")
             where_clause += f" AND DATE(created_at) >= ${len(params) + 1}"
-            params.append(start_datetime.date())
+            params.append(date.fromisoformat(start_date))
         
         if end_date:
-            from datetime import datetime
-            end_datetime = datetime.strptime(end_date, "%Y-%m-%d")
             where_clause += f" AND DATE(created_at) <= ${len(params) + 1}"
-            params.append(end_datetime.date())
+            params.append(date.fromisoformat(end_date))
         
-        total_count = await conn.fetchval(
-            f"SELECT COUNT(*) FROM tracker_alerts {where_clause}",
-            *params
-        )
+        # The counters take the acknowledged filter as FILTER clauses so the
+        # acknowledged count sees the rows the listing hides
+        counts = await fetch_alert_counts(conn, where_clause, params, unread_only)
+        total_count = counts["total"]
+        
+        if unread_only:
+            where_clause += f" AND {UNREAD_PREDICATE}"
+        
+        # With a cursor, seek straight past the previous page instead of scanning OFFSET rows
+        page_clause = where_clause
+        page_params = list(params)
+        if cursor:
+            cursor_created_at, cursor_id = decode_alert_cursor(cursor)
+            page_clause += f" AND (created_at, id) < (${len(page_params) + 1}, ${len(page_params) + 2})"
+            page_params.extend([cursor_created_at, cursor_id])
+            offset = 0
         
         alerts = await conn.fetch(
             f"""
-            SELECT * FROM tracker_alerts 
-            {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            SELECT {ALERT_LIST_COLUMNS} FROM tracker_alerts 
+            {page_clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${len(page_params) + 1} OFFSET ${len(page_params) + 2}
             """,
-            *params, limit, offset
+            *page_params, limit, offset
         )
         
         category_stats = await conn.fetch(
@@ -1313,93 +1958,14 @@ async def list_alerts(
         
         categories = {row["alert_type"] or "Other": row["count"] for row in category_stats}
         
-        unread_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND (acknowledged IS NULL OR acknowledged = FALSE)
-            """,
-            *params
-        ) or 0
+        bike_counts = await fetch_bike_priority_counts(conn, where_clause, params)
         
-        acknowledged_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND acknowledged = TRUE
-            """,
-            *params
-        ) or 0
-        
-        over_turn_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND alert_type = 'Over-turn'
-            """,
-            *params
-        ) or 0
-        
-        no_communication_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND alert_type LIKE '%No Communication%'
-            """,
-            *params
-        ) or 0
-        
-        heavy_impact_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND alert_type = 'Heavy Impact'
-            """,
-            *params
-        ) or 0
-        
-        device_alerts_data = await conn.fetch(
-            f"""
-            SELECT tracker_name, array_agg(DISTINCT alert_type) as alert_types
-            FROM tracker_alerts 
-            {where_clause}
-            GROUP BY tracker_name
-            """,
-            *params
-        )
-        
-        high_priority_count = 0
-        heavy_impact_bikes_count = 0
-        
-        for row in device_alerts_data:
-            alert_types = set(row["alert_types"] or [])
-            has_light_sensor = "Light Sensor" in alert_types
-            has_over_turn = "Over-turn" in alert_types
-            has_heavy_impact = any("Heavy Impact" in str(t) for t in alert_types if t)
-            has_no_comm = any("No Communication" in str(t) for t in alert_types if t)
-            
-            if has_light_sensor and has_over_turn:
-                heavy_impact_bikes_count += 1
-            elif has_over_turn or has_heavy_impact or has_no_comm:
-                high_priority_count += 1
-        
-        alert_list = []
-        for a in alerts:
-            ad = dict(a)
-            alert_list.append({
-                "id": ad.get("id"),
-                "alert_type": ad.get("alert_type"),
-                "alert_time": ad.get("alert_time"),
-                "location": ad.get("location"),
-                "latitude": ad.get("latitude"),
-                "longitude": ad.get("longitude"),
-                "device_serial": ad.get("device_serial"),
-                "tracker_name": ad.get("tracker_name"),
-                "account_name": ad.get("account_name"),
-                "status": ad.get("status", "New"),
-                "acknowledged": ad.get("acknowledged", False),
-                "acknowledged_at": str(ad.get("acknowledged_at")) if ad.get("acknowledged_at") else None,
-                "acknowledged_by": ad.get("acknowledged_by"),
-                "notes": ad.get("notes"),
-                "assigned_to": ad.get("assigned_to"),
-                "favorite": ad.get("favorite", False),
-                "created_at": ad.get("created_at").isoformat() if ad.get("created_at") else None
-            })
+        # The query selects exactly ALERT_LIST_FIELDS, so each Record converts
+        # straight to the response dict; acknowledged_at keeps its str() format
+        alert_list = [dict(a) for a in alerts]
+        for ad in alert_list:
+            if ad["acknowledged_at"]:
+                ad["acknowledged_at"] = str(ad["acknowledged_at"])
         
         total_pages = (total_count + limit - 1) // limit
         
@@ -1407,13 +1973,13 @@ async def list_alerts(
             "alerts": alert_list,
             "stats": {
                 "total": total_count,
-                "unread": unread_count,
-                "highPriority": high_priority_count,
-                "heavyImpact": heavy_impact_bikes_count,
-                "acknowledged": acknowledged_count,
-                "overTurn": over_turn_count,
-                "noCommunication": no_communication_count,
-                "heavyImpactAlerts": heavy_impact_count,
+                "unread": counts["unread"],
+                "highPriority": bike_counts["high_priority"],
+                "heavyImpact": bike_counts["heavy_impact_bikes"],
+                "acknowledged": counts["acknowledged"],
+                "overTurn": counts["over_turn"],
+                "noCommunication": counts["no_communication"],
+                "heavyImpactAlerts": counts["heavy_impact"],
                 "categories": categories
             },
             "pagination": {
@@ -1422,7 +1988,8 @@ async def list_alerts(
                 "total": total_count,
                 "total_pages": total_pages,
                 "has_next": page < total_pages,
-                "has_prev": page > 1
+                "has_prev": page > 1,
+                "next_cursor": encode_alert_cursor(alerts[-1]) if len(alerts) == limit else None
             },
             "connected": bool(user and user['gmail_email']),
             "email": user['gmail_email'] if user else None,
@@ -1430,6 +1997,54 @@ async def list_alerts(
         }
 
 
+CSV_EXPORT_HEADER = [
+    'ID', 'Alert Type', 'Alert Time', 'Location', 'Latitude', 'Longitude',
+    'Device Serial', 'Tracker Name', 'Account Name', 'Status', 
+    'Acknowledged', 'Notes', 'Created At'
+]
+CSV_EXPORT_FLUSH_BYTES = 64 * 1024
+
+
+async def stream_alerts_csv(where_clause: str, params: list):
+    """Yield the export CSV in chunks straight off a server-side cursor"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_EXPORT_HEADER)
+    
+    # The generator runs after the handler returns, so it holds its own connection
+    async with db_pool.acquire() as conn:
+        async with conn.transaction():
+            async for alert in conn.cursor(
+                f"""
+                SELECT * FROM tracker_alerts 
+                {where_clause}
+                ORDER BY created_at DESC
+                """,
+                *params
+            ):
+                writer.writerow([
+                    alert['id'],
+                    alert['alert_type'],
+                    alert['alert_time'],
+                    alert['location'],
+                    alert['latitude'],
+                    alert['longitude'],
+                    alert['device_serial'],
+                    alert['tracker_name'],
+                    alert['account_name'],
+                    alert.get('status', 'New'),
+                    'Yes' if alert.get('acknowledged') else 'No',
+                    alert.get('notes', ''),
+                    alert['created_at']
+                ])
+                if output.tell() >= CSV_EXPORT_FLUSH_BYTES:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+    
+    yield output.getvalue()
+
+
 @api_router.get("/alerts/export")
 async def export_alerts_csv(
     category: Optional[str] = Query(None),
@@ -1438,65 +2053,28 @@ async def export_alerts_csv(
     current_user: dict = Depends(get_current_user)
 ):
     """Export alerts to CSV with optional category/date filters"""
-    async with db_pool.acquire() as conn:
-        where_clause = "WHERE user_id = $1"
-        params = [current_user['id']]
-        
-        if category and category != "All":
-            where_clause += f" AND alert_type = ${len(params) + 1}"
-            params.append(category)
-        
-        if date_from:
-            where_clause += f" AND created_at >= ${len(params) + 1}::timestamp"
-            params.append(date_from)
-        
-        if date_to:
-            where_clause += f" AND created_at <= ${len(params) + 1}::timestamp + interval '1 day'"
-            params.append(date_to)
-        
-        alerts = await conn.fetch(
-            f"""
-            SELECT * FROM tracker_alerts 
-            {where_clause}
-            ORDER BY created_at DESC
-            """,
-            *params
-        )
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        writer.writerow([
-            'ID', 'Alert Type', 'Alert Time', 'Location', 'Latitude', 'Longitude',
-            'Device Serial', 'Tracker Name', 'Account Name', 'Status', 
-            'Acknowledged', 'Notes', 'Created At'
-        ])
-        
-        for alert in alerts:
-            writer.writerow([
-                alert['id'],
-                alert['alert_type'],
-                alert['alert_time'],
-                alert['location'],
-                alert['latitude'],
-                alert['longitude'],
-                alert['device_serial'],
-                alert['tracker_name'],
-                alert['account_name'],
-                alert.get('status', 'New'),
-                'Yes' if alert.get('acknowledged') else 'No',
-                alert.get('notes', ''),
-                alert['created_at']
-            ])
-        
-        output.seek(0)
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=alerts_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            }
-        )
+    where_clause = "WHERE user_id = $1"
+    params = [current_user['id']]
+    
+    if category and category != "All":
+        where_clause += f" AND alert_type = ${len(params) + 1}"
+        params.append(category)
+    
+    if date_from:
+        where_clause += f" AND created_at >= ${len(params) + 1}::timestamp"
+        params.append(date_from)
+    
+    if date_to:
+        where_clause += f" AND created_at <= ${len(params) + 1}::timestamp + interval '1 day'"
+        params.append(date_to)
+    
+    return StreamingResponse(
+        stream_alerts_csv(where_clause, params),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=alerts_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        }
+    )
 
 
 @api_router.get("/alerts/stats-only")
@@ -1505,18 +2083,25 @@ async def get_stats_only(
     current_user: dict = Depends(get_current_user)
 ):
     """Get only statistics without alert list (for auto-refresh)"""
+    if not category or category == "All":
+        category = None
+    return await stats_cache.get(
+        (current_user['id'], category),
+        lambda: compute_stats_only(current_user['id'], category)
+    )
+
+
+async def compute_stats_only(user_id: str, category: Optional[str]):
+    """Build the stats-only payload for a user and optional category"""
     async with db_pool.acquire() as conn:
         where_clause = "WHERE user_id = $1"
-        params = [current_user['id']]
+        params = [user_id]
         
-        if category and category != "All":
+        if category:
             where_clause += " AND alert_type = $2"
             params.append(category)
         
-        total_count = await conn.fetchval(
-            f"SELECT COUNT(*) FROM tracker_alerts {where_clause}",
-            *params
-        )
+        counts = await fetch_alert_counts(conn, where_clause, params)
         
         category_stats = await conn.fetch(
             f"""
@@ -1530,72 +2115,17 @@ async def get_stats_only(
         
         categories = {row["alert_type"] or "Other": row["count"] for row in category_stats}
         
-        acknowledged_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND acknowledged = TRUE
-            """,
-            *params
-        ) or 0
-        
-        over_turn_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND alert_type = 'Over-turn'
-            """,
-            *params
-        ) or 0
-        
-        no_communication_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND alert_type LIKE '%No Communication%'
-            """,
-            *params
-        ) or 0
-        
-        heavy_impact_count = await conn.fetchval(
-            f"""
-            SELECT COUNT(*) FROM tracker_alerts 
-            {where_clause} AND alert_type = 'Heavy Impact'
-            """,
-            *params
-        ) or 0
-        
-        device_alerts_data = await conn.fetch(
-            f"""
-            SELECT tracker_name, array_agg(DISTINCT alert_type) as alert_types
-            FROM tracker_alerts 
-            {where_clause}
-            GROUP BY tracker_name
-            """,
-            *params
-        )
-        
-        high_priority_count = 0
-        heavy_impact_bikes_count = 0
-        
-        for row in device_alerts_data:
-            alert_types = set(row["alert_types"] or [])
-            has_light_sensor = "Light Sensor" in alert_types
-            has_over_turn = "Over-turn" in alert_types
-            has_heavy_impact = any("Heavy Impact" in str(t) for t in alert_types if t)
-            has_no_comm = any("No Communication" in str(t) for t in alert_types if t)
-            
-            if has_light_sensor and has_over_turn:
-                heavy_impact_bikes_count += 1
-            elif has_over_turn or has_heavy_impact or has_no_comm:
-                high_priority_count += 1
+        bike_counts = await fetch_bike_priority_counts(conn, where_clause, params)
         
         return {
             "stats": {
-                "total": total_count,
-                "highPriority": high_priority_count,
-                "heavyImpact": heavy_impact_bikes_count,
-                "acknowledged": acknowledged_count,
-                "overTurn": over_turn_count,
-                "noCommunication": no_communication_count,
-                "heavyImpactAlerts": heavy_impact_count,
+                "total": counts["total"],
+                "highPriority": bike_counts["high_priority"],
+                "heavyImpact": bike_counts["heavy_impact_bikes"],
+                "acknowledged": counts["acknowledged"],
+                "overTurn": counts["over_turn"],
+                "noCommunication": counts["no_communication"],
+                "heavyImpactAlerts": counts["heavy_impact"],
                 "categories": categories
             }
         }
@@ -1613,6 +2143,8 @@ async def clear_all_alerts(current_user: dict = Depends(get_current_user)):
             "DELETE FROM sync_checkpoints WHERE user_id = $1",
             current_user['id']
         )
+    invalidate_user_caches(current_user['id'])
+    email_id_filters.pop(current_user['id'], None)
     
     return {"success": True, "message": "All alerts and sync history cleared"}
 
@@ -1643,6 +2175,7 @@ async def acknowledge_alert(alert_id: int, request: AcknowledgeRequest, current_
             """,
             request.acknowledged_by, alert_id, current_user['id']
         )
+    invalidate_user_caches(current_user['id'])
     
     return {"success": True}
 
@@ -1725,9 +2258,11 @@ async def toggle_favorite(alert_id: int, current_user: dict = Depends(get_curren
 @api_router.get("/bikes/list")
 async def list_bikes(current_user: dict = Depends(get_current_user)):
     """Get all bikes for the current user with alert counts - OPTIMIZED & SECURE"""
+    # Single optimized query with proper user_id scoping; Postgres renders the
+    # timestamps and builds the response body, so rows never become Python
+    # objects
     async with db_pool.acquire() as conn:
-        # Single optimized query with proper user_id scoping
-        bikes = await conn.fetch(
+        payload = await conn.fetchval(
             """
             WITH bike_data AS (
                 SELECT 
@@ -1748,36 +2283,30 @@ async def list_bikes(current_user: dict = Depends(get_current_user)):
                     latest_alert_at = EXCLUDED.latest_alert_at,
                     device_serial = EXCLUDED.device_serial
                 RETURNING id, user_id, tracker_name
+            ),
+            bike_rows AS (
+                SELECT 
+                    bi.id,
+                    bd.tracker_name,
+                    bd.device_serial,
+                    bd.latest_alert_at,
+                    bd.alert_count,
+                    COALESCE(COUNT(bn.id), 0) as notes_count
+                FROM bike_data bd
+                JOIN bike_ids bi ON bi.user_id = bd.user_id AND bi.tracker_name = bd.tracker_name
+                LEFT JOIN bike_notes bn ON bn.bike_id = bi.id
+                WHERE bd.user_id = $1
+                GROUP BY bi.id, bd.tracker_name, bd.device_serial, bd.latest_alert_at, bd.alert_count
             )
-            SELECT 
-                bi.id,
-                bd.tracker_name,
-                bd.device_serial,
-                bd.latest_alert_at,
-                bd.alert_count,
-                COALESCE(COUNT(bn.id), 0) as notes_count
-            FROM bike_data bd
-            JOIN bike_ids bi ON bi.user_id = bd.user_id AND bi.tracker_name = bd.tracker_name
-            LEFT JOIN bike_notes bn ON bn.bike_id = bi.id
-            WHERE bd.user_id = $1
-            GROUP BY bi.id, bd.tracker_name, bd.device_serial, bd.latest_alert_at, bd.alert_count
-            ORDER BY bd.latest_alert_at DESC
+            SELECT json_build_object(
+                'bikes', COALESCE(json_agg(r ORDER BY r.latest_alert_at DESC), '[]')
+            )
+            FROM bike_rows r
             """,
             current_user['id']
         )
-        
-        result = []
-        for bike in bikes:
-            result.append({
-                "id": bike['id'],
-                "tracker_name": bike['tracker_name'],
-                "device_serial": bike['device_serial'],
-                "latest_alert_at": bike['latest_alert_at'].isoformat() if bike['latest_alert_at'] else None,
-                "alert_count": bike['alert_count'],
-                "notes_count": bike['notes_count']
-            })
-        
-        return {"bikes": result}
+    
+    return Response(content=payload, media_type="application/json")
 
 
 @api_router.get("/bikes/paginated")
@@ -1849,7 +2378,7 @@ async def get_bikes_paginated(
                 "tracker_name": bike['tracker_name'],
                 "device_serial": bike['device_serial'],
                 "alert_count": bike['alert_count'],
-                "latest_alert_at": bike['latest_alert_at'].isoformat() if bike['latest_alert_at'] else None,
+                "latest_alert_at": bike['latest_alert_at'],
                 "alert_types": bike['alert_types']
             })
         
@@ -1869,93 +2398,128 @@ async def get_bikes_paginated(
 
 
 @api_router.get("/bikes/{bike_id}/history")
-async def get_bike_history(bike_id: int, current_user: dict = Depends(get_current_user)):
+async def get_bike_history(
+    bike_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    current_user: dict = Depends(get_current_user)
+):
     """Get bike details with alerts and notes history"""
+    # Alerts page by keyset on (created_at, id), the same cursor /alerts/list
+    # hands out, so older pages seek the tracker index instead of using OFFSET
+    params = [bike_id, limit]
+    seek_clause = ""
+    if cursor:
+        cursor_created_at, cursor_id = decode_alert_cursor(cursor)
+        seek_clause = "AND (created_at, id) < ($3, $4)"
+        params.extend([cursor_created_at, cursor_id])
+    
+    # One round-trip: Postgres builds the whole response body, so it is passed
+    # through without decoding or re-encoding
     async with db_pool.acquire() as conn:
-        bike = await conn.fetchrow(
-            """
-            SELECT * FROM bikes
-            WHERE id = $1
+        payload = await conn.fetchval(
+            f"""
+            SELECT json_build_object(
+                'bike', json_build_object(
+                    'id', b.id,
+                    'tracker_name', b.tracker_name,
+                    'device_serial', b.device_serial,
+                    'latest_alert_at', b.latest_alert_at
+                ),
+                'alerts', COALESCE(page.alerts, '[]'),
+                'next_cursor', page.next_cursor,
+                'notes', COALESCE((
+                    SELECT json_agg(n ORDER BY n.created_at DESC, n.id DESC)
+                    FROM bike_notes n
+                    WHERE n.bike_id = b.id
+                ), '[]')
+            )
+            FROM bikes b
+            CROSS JOIN LATERAL (
+                SELECT
+                    json_agg(a ORDER BY a.created_at DESC, a.id DESC) AS alerts,
+                    CASE WHEN COUNT(*) = $2 THEN
+                        (array_agg(
+                            to_char(a.created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US') || '_' || a.id
+                            ORDER BY a.created_at, a.id
+                        ))[1]
+                    END AS next_cursor
+                FROM (
+                    SELECT {ALERT_LIST_COLUMNS} FROM tracker_alerts
+                    WHERE tracker_name = b.tracker_name {seek_clause}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT $2
+                ) a
+            ) page
+            WHERE b.id = $1
             """,
-            bike_id
+            *params
         )
+    
+    if not payload:
+        raise HTTPException(status_code=404, detail="Bike not found")
+    
+    return Response(content=payload, media_type="application/json")
+
+
+@api_router.post("/bikes/{bike_id}/notes")
+async def add_bike_note(
+    bike_id: int, 
+    request: AddBikeNoteRequest, 
+    current_user: dict = Depends(get_current_user)
+):
+    """Add a note to a bike"""
+    async with db_pool.acquire() as conn:
+        bike = await conn.fetchrow(BIKE_EXISTS_SQL, bike_id)
         
         if not bike:
             raise HTTPException(status_code=404, detail="Bike not found")
         
-        alerts = await conn.fetch(
-            """
-            SELECT * FROM tracker_alerts
-            WHERE tracker_name = $1
-            ORDER BY created_at DESC
-            LIMIT 50
-            """,
-            bike['tracker_name']
-        )
-        
-        notes = await conn.fetch(
-            """
-            SELECT * FROM bike_notes
-            WHERE bike_id = $1
-            ORDER BY created_at DESC
-            """,
-            bike_id
+        note = await conn.fetchrow(
+            INSERT_BIKE_NOTE_SQL,
+            bike_id, current_user['id'], request.note, current_user.get('username', 'User')
         )
         
-        return {
-            "bike": {
-                "id": bike['id'],
-                "tracker_name": bike['tracker_name'],
-                "device_serial": bike['device_serial'],
-                "latest_alert_at": bike['latest_alert_at'].isoformat() if bike['latest_alert_at'] else None
-            },
-            "alerts": [dict(alert) for alert in alerts],
-            "notes": [dict(note) for note in notes]
-        }
+        return {"success": True, "note": dict(note)}
 
 
-@api_router.post("/bikes/{bike_id}/notes")
-async def add_bike_note(
+@api_router.post("/bikes/{bike_id}/notes/bulk")
+async def add_bike_notes_bulk(
     bike_id: int, 
-    request: AddBikeNoteRequest, 
+    request: AddBikeNotesBulkRequest, 
     current_user: dict = Depends(get_current_user)
 ):
-    """Add a note to a bike"""
+    """Add several notes to a bike in one statement"""
     async with db_pool.acquire() as conn:
-        bike = await conn.fetchrow(
-            """
-            SELECT * FROM bikes
-            WHERE id = $1
-            """,
-            bike_id
-        )
+        bike = await conn.fetchrow(BIKE_EXISTS_SQL, bike_id)
         
         if not bike:
             raise HTTPException(status_code=404, detail="Bike not found")
         
-        note = await conn.fetchrow(
+        notes = await conn.fetch(
             """
             INSERT INTO bike_notes (bike_id, user_id, note, author, created_at)
-            VALUES ($1, $2, $3, $4, CURRENT_TIMESTAMP)
+            SELECT $1, $2, note, $3, CURRENT_TIMESTAMP
+            FROM unnest($4::text[]) WITH ORDINALITY AS t(note, position)
+            ORDER BY position
             RETURNING *
             """,
-            bike_id, request.note, current_user.get('username', 'User')
+            bike_id, current_user['id'], current_user.get('username', 'User'), request.notes
         )
         
-        return {"success": True, "note": dict(note)}
+        return {"success": True, "notes": [dict(note) for note in notes]}
 
 
 @api_router.delete("/bikes/notes/{note_id}")
-async def delete_bike_note(note_id: int, current_user: dict = Depends(get_current_user)):
+async def delete_bike_note(note_id: int, user_id: str = Depends(get_current_user_id)):
     """Delete a bike note"""
+    # Ownership is part of the WHERE clause; no returned row means the note
+    # doesn't exist or belongs to someone else
     async with db_pool.acquire() as conn:
-        await conn.execute(
-            """
-            DELETE FROM bike_notes
-            WHERE id = $1
-            """,
-            note_id, current_user['id']
-        )
+        deleted = await conn.fetchval(DELETE_BIKE_NOTE_SQL, note_id, user_id)
+    
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Note not found")
     
     return {"success": True}
 
@@ -1976,45 +2540,49 @@ async def update_bike_note(note_id: int, request: AddBikeNoteRequest, current_us
     return {"success": True}
 
 
-@api_router.get("/bikes/by-tracker/{tracker_name}")
-async def get_bike_by_tracker_name(tracker_name: str, current_user: dict = Depends(get_current_user)):
-    """Get bike ID by tracker name"""
+@api_router.post("/bikes/resolve-trackers")
+async def resolve_trackers(request: ResolveTrackersRequest, current_user: dict = Depends(get_current_user)):
+    """Get bike IDs for many tracker names, creating bikes from their alerts as needed"""
+    tracker_names = list(dict.fromkeys(request.tracker_names))
+    
     async with db_pool.acquire() as conn:
-        bike = await conn.fetchrow(
+        rows = await conn.fetch(
             """
-            SELECT id FROM bikes
-            WHERE tracker_name = $1
+            SELECT id, tracker_name FROM bikes
+            WHERE user_id = $1 AND tracker_name = ANY($2::varchar[])
             """,
-            current_user['id'], tracker_name
+            current_user['id'], tracker_names
         )
+        bikes = {row['tracker_name']: row['id'] for row in rows}
         
-        if not bike:
-            bike_from_alert = await conn.fetchrow(
+        missing = [name for name in tracker_names if name not in bikes]
+        if missing:
+            created = await conn.fetch(
                 """
-                SELECT DISTINCT ON (tracker_name) 
-                    tracker_name, device_serial,
-                    MAX(created_at) as latest_alert_at
+                INSERT INTO bikes (user_id, tracker_name, device_serial, latest_alert_at)
+                SELECT $1, tracker_name, MAX(device_serial), MAX(created_at)
                 FROM tracker_alerts
-                WHERE tracker_name = $1
-                GROUP BY tracker_name, device_serial
+                WHERE user_id = $1 AND tracker_name = ANY($2::varchar[])
+                GROUP BY tracker_name
+                ON CONFLICT (user_id, tracker_name) 
+                DO UPDATE SET latest_alert_at = EXCLUDED.latest_alert_at
+                RETURNING id, tracker_name
                 """,
-                current_user['id'], tracker_name
+                current_user['id'], missing
             )
-            
-            if bike_from_alert:
-                bike = await conn.fetchrow(
-                    """
-                    INSERT INTO bikes (user_id, tracker_name, device_serial, latest_alert_at)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (user_id, tracker_name) 
-                    DO UPDATE SET 
-                        latest_alert_at = EXCLUDED.latest_alert_at,
-                        device_serial = EXCLUDED.device_serial
-                    RETURNING id
-                    """,
-                    current_user['id'], bike_from_alert['tracker_name'], 
-                    bike_from_alert['device_serial'], bike_from_alert['latest_alert_at']
-                )
+            bikes.update({row['tracker_name']: row['id'] for row in created})
+    
+    return {
+        "bikes": bikes,
+        "not_found": [name for name in tracker_names if name not in bikes]
+    }
+
+
+@api_router.get("/bikes/by-tracker/{tracker_name}")
+async def get_bike_by_tracker_name(tracker_name: str, current_user: dict = Depends(get_current_user)):
+    """Get bike ID by tracker name"""
+    async with db_pool.acquire() as conn:
+        bike = await conn.fetchrow(BIKE_ID_BY_TRACKER_SQL, current_user['id'], tracker_name)
         
         if not bike:
             raise HTTPException(status_code=404, detail="Bike not found")
@@ -2023,7 +2591,7 @@ async def get_bike_by_tracker_name(tracker_name: str, current_user: dict = Depen
 
 
 @api_router.get("/sync/config")
-async def get_sync_config(current_user: dict = Depends(get_current_user)):
+async def get_sync_config(user_id: str = Depends(get_current_user_id)):
     """Get sync configuration for current user - Fixed values: 5 min interval, 30 email limit"""
     return {
         "sync_interval_minutes": 5,
@@ -2032,62 +2600,21 @@ async def get_sync_config(current_user: dict = Depends(get_current_user)):
 
 
 @api_router.post("/sync/config")
-async def update_sync_config(request: dict, current_user: dict = Depends(get_current_user)):
+async def update_sync_config(request: dict, user_id: str = Depends(get_current_user_id)):
     """Update sync configuration for current user - Fixed values: 5 min, 30 emails"""
-    # Fixed values - ignore request parameters
-    sync_interval = 5
-    email_limit = 30
-    
-    async with db_pool.acquire() as conn:
-        await conn.execute(
-            """
-            UPDATE users 
-            SET sync_interval_minutes = $1, 
-                email_limit_per_sync = $2,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = $3
-            """,
-            sync_interval, email_limit, current_user['id']
-        )
-    
+    # Fixed values - request parameters are ignored and nothing is persisted
     return {"success": True, "message": "Sync configuration updated successfully"}
 
 
 @api_router.get("/system/status")
-async def get_system_status(current_user: dict = Depends(get_current_user)):
+async def get_system_status(user_id: str = Depends(get_current_user_id)):
     """Get system status information"""
     try:
-        async with db_pool.acquire() as conn:
-            # Check database connection
-            db_connected = True
-            
-            # Check Gmail connection
-            gmail_connected = bool(current_user and current_user.get('gmail_email') and current_user.get('gmail_app_password'))
-            
-            # Get last sync info
-            sync_checkpoint = await conn.fetchrow(
-                "SELECT last_email_id, last_sync_at FROM sync_checkpoints WHERE user_id = $1",
-                current_user['id']
-            )
-            
-            last_sync_at = str(sync_checkpoint['last_sync_at']) if sync_checkpoint and sync_checkpoint['last_sync_at'] else None
-            last_email_id = sync_checkpoint['last_email_id'] if sync_checkpoint else None
-            
-            # Get total alerts count
-            total_alerts = await conn.fetchval(
-                "SELECT COUNT(*) FROM tracker_alerts WHERE user_id = $1",
-                current_user['id']
-            ) or 0
-            
-            return {
-                "database_connected": db_connected,
-                "gmail_connected": gmail_connected,
-                "gmail_email": current_user.get('gmail_email') if gmail_connected else None,
-                "last_sync_at": last_sync_at,
-                "last_email_id": last_email_id,
-                "total_alerts": total_alerts,
-                "system_healthy": db_connected and gmail_connected
-            }
+        # Dashboards poll this; serve repeats from a short per-user cache
+        status = await status_cache.get(
+            (user_id,),
+            lambda: compute_system_status(user_id)
+        )
     except Exception as e:
         logger.error(f"Error getting system status: {str(e)}")
         return {
@@ -2099,11 +2626,54 @@ async def get_system_status(current_user: dict = Depends(get_current_user)):
             "total_alerts": 0,
             "system_healthy": False
         }
+    
+    if status is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    
+    return status
+
+
+async def compute_system_status(user_id: str):
+    """Build the system status payload for a user, or None if the user is gone"""
+    # One row: the user's Gmail settings and alert counter plus the sync checkpoint
+    row = await db_pool.fetchrow(
+        """
+        SELECT u.gmail_email, u.gmail_app_password, u.alerts_count,
+               c.last_email_id, c.last_sync_at
+        FROM users u
+        LEFT JOIN sync_checkpoints c ON c.user_id = u.id
+        WHERE u.id = $1
+        """,
+        user_id
+    )
+    
+    if not row:
+        return None
+    
+    # Check database connection
+    db_connected = True
+    
+    # Check Gmail connection
+    gmail_connected = bool(row['gmail_email'] and row['gmail_app_password'])
+    
+    last_sync_at = str(row['last_sync_at']) if row['last_sync_at'] else None
+    
+    return {
+        "database_connected": db_connected,
+        "gmail_connected": gmail_connected,
+        "gmail_email": row['gmail_email'] if gmail_connected else None,
+        "last_sync_at": last_sync_at,
+        "last_email_id": row['last_email_id'],
+        "total_alerts": row['alerts_count'],
+        "system_healthy": db_connected and gmail_connected
+    }
 
 
 app.include_router(api_router)
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Responses are compressed per request; level 4 keeps nearly all of level 9's
+# size reduction at a fraction of the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=4)
 
 allowed_origins = [
     "http://localhost:5000",
@@ -0,0 +1,32 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import asyncpg
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from server import insert_alerts_one_by_one  # noqa: E402
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection that rejects one email id"""
+
+    def __init__(self, bad_email_id):
+        self.bad_email_id = bad_email_id
+
+    async def fetchval(self, query, user_id, *columns):
+        if columns[0] == [self.bad_email_id]:
+            raise asyncpg.CharacterNotInRepertoireError("invalid byte sequence")
+        return 1
+
+    def is_closed(self):
+        return False
+
+
+def test_bad_row_is_skipped_and_the_rest_stored():
+    email_ids = ["1", "2", "3"]
+    columns = [email_ids] + [["x"] * 3 for _ in range(9)]
+    inserted, stored_ids = asyncio.run(insert_alerts_one_by_one(FakeConnection("2"), "user", columns))
+    assert inserted == 2
+    assert stored_ids == ["1", "3"]
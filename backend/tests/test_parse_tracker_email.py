@@ -0,0 +1,53 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from server import parse_tracker_email  # noqa: E402
+
+PLAIN_BODY = "\n".join([
+    "Alert type: Heavy impact",
+    "Time: 2024-01-01 10:00 (UTC)",
+    "Location: Here",
+    "Latitude, Longitude: 51.5, -0.1",
+    "Device Serial Number: ABC",
+    "Tracker Name: Bike 1",
+    "Account name: Acme",
+])
+
+EXPECTED = {
+    "alert_type": "Heavy impact",
+    "time": "2024-01-01 10:00",
+    "location": "Here",
+    "latitude": "51.5",
+    "longitude": "-0.1",
+    "device_serial": "ABC",
+    "tracker_name": "Bike 1",
+    "account_name": "Acme",
+}
+
+
+def test_plain_body():
+    assert parse_tracker_email(PLAIN_BODY) == EXPECTED
+
+
+def test_prefixed_and_marked_up_labels():
+    lines = PLAIN_BODY.splitlines()
+    bodies = [
+        "\n".join("- " + line for line in lines),
+        "\n".join("> " + line for line in lines),
+        "\n".join("**" + line.replace(":", ":**", 1) for line in lines),
+        "\n".join("<b>" + line.replace(":", ":</b>", 1) + "<br>" for line in lines),
+    ]
+    for body in bodies:
+        assert parse_tracker_email(body) == EXPECTED
+
+
+def test_interior_whitespace_parses_in_linear_time():
+    body = "Tracker Name: a" + " " * 5000 + "b x\n<b>Location:</b>" + " " * 5000 + "y"
+    start = time.perf_counter()
+    data = parse_tracker_email(body)
+    assert time.perf_counter() - start < 0.5
+    assert data["tracker_name"] == "a" + " " * 5000 + "b x"
+    assert data["location"] == "y"
@@ -4,10 +4,16 @@ Backend Smoke Tests for Alert Tracker System
 Tests the Neon-only setup with cookie-based authentication
 """
 
-import requests
+import argparse
+import asyncio
+import importlib.util
+import httpx
+import orjson
 import json
+import os
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
 # Get backend URL from frontend .env
 def get_backend_url():
@@ -28,31 +34,51 @@ if not BASE_URL:
 API_URL = f"{BASE_URL}/api"
 print(f"Testing backend at: {API_URL}")
 
+# Recorded responses for --replay/--record runs (holds session cookies, not committed)
+CASSETTE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend_test.yaml")
+
 class BackendTester:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, client):
+        self.client = client
         self.test_results = []
+        self.passed = 0
+        self.failed_tests = []
+        self._log_buf = []
+        # Wall-clock anchor for the relative t_rel offsets, taken once
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.t0 = time.perf_counter()
         
     def log_test(self, test_name, success, message, response=None):
         """Log test result"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}: {message}")
+        self._log_buf.append(f"{status} {test_name}: {message}")
         
         result = {
             "test": test_name,
             "success": success,
             "message": message,
-            "timestamp": datetime.now().isoformat()
+            "t_rel": time.perf_counter() - self.t0  # seconds since the suite started
         }
         
         if response:
             result["status_code"] = response.status_code
-            result["headers"] = dict(response.headers)
+            result["content_type"] = response.headers.get("Content-Type")
+            result["has_set_cookie"] = "Set-Cookie" in response.headers
             
         self.test_results.append(result)
+        if success:
+            self.passed += 1
+        else:
+            self.failed_tests.append(result)
         return success
     
-    def test_login_authentication(self):
+    def flush_log(self):
+        """Write the buffered result lines in one go"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
+    
+    async def test_login_authentication(self):
         """Test 1: POST /api/auth/login with admin/dimension credentials"""
         print("\n=== Test 1: Login Authentication ===")
         
@@ -62,10 +88,10 @@ class BackendTester:
                 "password": "dimension"
             }
             
-            response = self.session.post(f"{API_URL}/auth/login", json=login_data)
+            response = await self.client.post(f"{API_URL}/auth/login", json=login_data)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Check for user object
                 if "user" not in data:
@@ -95,15 +121,15 @@ class BackendTester:
         except Exception as e:
             return self.log_test("Login Auth", False, f"Exception during login: {str(e)}")
     
-    def test_alerts_categories(self):
+    async def test_alerts_categories(self):
         """Test 2: GET /api/alerts/categories with auth cookie"""
         print("\n=== Test 2: Alerts Categories with Auth ===")
         
         try:
-            response = self.session.get(f"{API_URL}/alerts/categories")
+            response = await self.client.get(f"{API_URL}/alerts/categories")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if "categories" not in data:
                     return self.log_test("Alerts Categories", False, "Response missing 'categories' array", response)
@@ -123,15 +149,15 @@ class BackendTester:
         except Exception as e:
             return self.log_test("Alerts Categories", False, f"Exception during categories request: {str(e)}")
     
-    def test_alerts_list_basic(self):
+    async def test_alerts_list_basic(self):
         """Test 3: GET /api/alerts/list with limit=5"""
         print("\n=== Test 3: Alerts List Basic (limit=5) ===")
         
         try:
-            response = self.session.get(f"{API_URL}/alerts/list?limit=5")
+            response = await self.client.get(f"{API_URL}/alerts/list?limit=5")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if "alerts" not in data:
                     return self.log_test("Alerts List Basic", False, "Response missing 'alerts' array", response)
@@ -163,15 +189,15 @@ class BackendTester:
         except Exception as e:
             return self.log_test("Alerts List Basic", False, f"Exception during alerts list request: {str(e)}")
     
-    def test_bikes_list(self):
+    async def test_bikes_list(self):
         """Test 4: GET /api/bikes/list with auth cookie"""
         print("\n=== Test 4: Bikes List with Auth ===")
         
         try:
-            response = self.session.get(f"{API_URL}/bikes/list")
+            response = await self.client.get(f"{API_URL}/bikes/list")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if "bikes" not in data:
                     return self.log_test("Bikes List", False, "Response missing 'bikes' array", response)
@@ -188,7 +214,7 @@ class BackendTester:
         except Exception as e:
             return self.log_test("Bikes List", False, f"Exception during bikes list request: {str(e)}")
     
-    def test_gmail_connect_error_handling(self):
+    async def test_gmail_connect_error_handling(self):
         """Test 5: POST /api/gmail/connect with dummy payload should fail gracefully"""
         print("\n=== Test 5: Gmail Connect Error Handling ===")
         
@@ -198,12 +224,12 @@ class BackendTester:
                 "app_password": "invalid_password"
             }
             
-            response = self.session.post(f"{API_URL}/gmail/connect", json=dummy_payload)
+            response = await self.client.post(f"{API_URL}/gmail/connect", json=dummy_payload)
             
             # Should fail with 400 and error message
             if response.status_code == 400:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if "detail" in data and isinstance(data["detail"], str):
                         return self.log_test("Gmail Connect Error", True, f"Gmail connect failed gracefully with error: {data['detail']}", response)
                     else:
@@ -223,15 +249,15 @@ class BackendTester:
         except Exception as e:
             return self.log_test("Gmail Connect Error", False, f"Exception during gmail connect test: {str(e)}")
     
-    def test_alerts_list_high_limit(self):
+    async def test_alerts_list_high_limit(self):
         """Test 6: GET /api/alerts/list with limit=5000 (verify no 200 cap enforcement)"""
         print("\n=== Test 6: Alerts List High Limit (limit=5000) ===")
         
         try:
-            response = self.session.get(f"{API_URL}/alerts/list?limit=5000")
+            response = await self.client.get(f"{API_URL}/alerts/list?limit=5000")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if "alerts" not in data:
                     return self.log_test("Alerts List High Limit", False, "Response missing 'alerts' array", response)
@@ -259,32 +285,37 @@ class BackendTester:
         except Exception as e:
             return self.log_test("Alerts List High Limit", False, f"Exception during alerts list high limit test: {str(e)}")
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all backend smoke tests"""
         print(f"🚀 Starting Backend Smoke Tests")
         print(f"Backend URL: {API_URL}")
         print("=" * 60)
         
         # Test 1: Login (must succeed for subsequent tests)
-        login_success = self.test_login_authentication()
+        login_success = await self.test_login_authentication()
+        self.flush_log()
         
         if not login_success:
             print("\n❌ LOGIN FAILED - Cannot proceed with authenticated tests")
             return False
         
-        # Test 2-6: Other endpoints (can run even if some fail)
-        self.test_alerts_categories()
-        self.test_alerts_list_basic()
-        self.test_bikes_list()
-        self.test_gmail_connect_error_handling()
-        self.test_alerts_list_high_limit()
+        # Test 2-6: Other endpoints (independent of each other, so they run
+        # concurrently on the logged-in client; results may print out of order)
+        await asyncio.gather(
+            self.test_alerts_categories(),
+            self.test_alerts_list_basic(),
+            self.test_bikes_list(),
+            self.test_gmail_connect_error_handling(),
+            self.test_alerts_list_high_limit()
+        )
+        self.flush_log()
         
         # Summary
         print("\n" + "=" * 60)
         print("🏁 TEST SUMMARY")
         print("=" * 60)
         
-        passed = sum(1 for result in self.test_results if result["success"])
+        passed = self.passed
         total = len(self.test_results)
         
         print(f"Total Tests: {total}")
@@ -297,12 +328,56 @@ class BackendTester:
         else:
             print("⚠️  SOME TESTS FAILED")
             print("\nFailed Tests:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"  - {result['test']}: {result['message']}")
+            for result in self.failed_tests:
+                print(f"  - {result['test']}: {result['message']}")
             return False
 
+async def main(json_out=None):
+    # One client for the whole run: it keeps the auth cookies from login and
+    # reuses its connections across the concurrent tests. Keep every pooled
+    # connection alive so no test pays a fresh TLS handshake, and retry
+    # failed connects twice before a test is marked as failed. A hung endpoint
+    # fails its test after 10s instead of holding up the whole gather
+    timeout = httpx.Timeout(10.0, connect=3.0)
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    # Multiplex the gathered tests over one connection when h2 (httpx[http2])
+    # is installed; without it httpx stays on HTTP/1.1 keep-alive
+    http2 = importlib.util.find_spec("h2") is not None
+    transport = httpx.AsyncHTTPTransport(http2=http2, retries=2, limits=limits)
+    async with httpx.AsyncClient(timeout=timeout, transport=transport, headers={"Connection": "keep-alive"}) as client:
+        tester = BackendTester(client)
+        success = await tester.run_all_tests()
+    
+    if json_out:
+        # t_rel is a plain float, so orjson serializes every result without a default hook
+        report = {"started_at": tester.started_at, "results": tester.test_results}
+        with open(json_out, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    
+    return success
+
 if __name__ == "__main__":
-    tester = BackendTester()
-    success = tester.run_all_tests()
+    parser = argparse.ArgumentParser(description="Backend smoke tests")
+    parser.add_argument("--replay", action="store_true", help="serve recorded responses, record only new requests")
+    parser.add_argument("--record", action="store_true", help="re-record the whole cassette")
+    parser.add_argument("--json-out", metavar="PATH", help="also write the test results as JSON to PATH")
+    args = parser.parse_args()
+    
+    # Default is a live run. --replay serves responses already in the cassette
+    # and only records new requests; --record re-records the whole cassette
+    record_mode = "all" if args.record else "new_episodes" if args.replay else None
+    
+    if record_mode:
+        try:
+            import vcr
+        except ImportError:
+            sys.exit("--replay/--record need vcrpy: pip install vcrpy")
+        with vcr.use_cassette(
+            CASSETTE_PATH,
+            record_mode=record_mode,
+            match_on=["method", "scheme", "host", "path", "query", "body"]
+        ):
+            success = asyncio.run(main(args.json_out))
+    else:
+        success = asyncio.run(main(args.json_out))
     sys.exit(0 if success else 1)
\ No newline at end of file